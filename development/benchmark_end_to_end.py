@@ -0,0 +1,210 @@
+#!/usr/bin/env python
+# coding: utf-8
+"""
+Benchmark: End-to-end with the fake Billomat server
+
+Starts *fake_billomat_server.py* and runs every scenario in a new
+interpreter process against it. Measured per scenario:
+
+- throughput (objects per second)
+- p50 and p99 latency of the HTTP-requests
+- peak RSS of the process
+
+Scenarios:
+
+- iterate: ``InvoicesIterator`` page by page
+- iterate_prefetch: ``InvoicesIterator`` with *prefetch_pages*
+- fetch_all: ``Invoices.search(fetch_all = True, fetch_all_workers = ...)``
+- create: ``Invoice.create_many`` with invoice items
+- edit: ``Invoice.edit_async`` over an *AsyncConnection*
+
+Usage::
+
+    python development/benchmark_end_to_end.py [--records N] [--latency S]
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import threading
+import time
+
+THISDIR = os.path.dirname(os.path.abspath(__file__))
+APPDIR = os.path.abspath(os.path.join(THISDIR, os.path.pardir))
+sys.path.insert(0, APPDIR)
+
+SCENARIOS = ["iterate", "iterate_prefetch", "fetch_all", "create", "edit"]
+WORKERS = 8
+
+
+def _get_connection_class():
+    """
+    Returns an *AsyncConnection*-subclass which measures the duration
+    of every request
+    """
+
+    import pybillomat
+
+    class TimedConnection(pybillomat.AsyncConnection):
+
+        def __init__(self, *args, **kwargs):
+            pybillomat.AsyncConnection.__init__(self, *args, **kwargs)
+            self.latencies = []
+            self._latencies_lock = threading.Lock()
+
+
+        def _request(self, method, send):
+            start = time.time()
+            response = pybillomat.AsyncConnection._request(self, method, send)
+            duration = time.time() - start
+            with self._latencies_lock:
+                self.latencies.append(duration)
+            return response
+
+    return TimedConnection
+
+
+def percentile(values, percent):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    index = int(round((len(values) - 1) * percent / 100.0))
+    return values[index]
+
+
+def run_scenario(name, url, records):
+    """
+    Runs one scenario in this process
+
+    :returns: Dictionary with the results
+    """
+
+    import pybillomat
+    from pybillomat.invoices import Invoices, InvoicesIterator
+
+    conn = _get_connection_class()(
+        "fake", "fake", base_url = url, workers = WORKERS
+    )
+    start = time.time()
+
+    if name in ("iterate", "iterate_prefetch"):
+        iterator = InvoicesIterator(conn, per_page = 100)
+        if name == "iterate_prefetch":
+            iterator.prefetch_pages = WORKERS
+        iterator.search(status = "DRAFT")
+        count = sum(1 for invoice in iterator)
+
+    elif name == "fetch_all":
+        invoices = Invoices(conn)
+        invoices.search(
+            status = "DRAFT",
+            fetch_all = True,
+            fetch_all_workers = WORKERS,
+            per_page = 100
+        )
+        count = len(invoices)
+
+    elif name == "create":
+        arguments_list = [
+            {
+                "client_id": index % 100 + 1,
+                "title": u"Invoice {0}".format(index),
+                "invoice_items": [
+                    {"title": u"Item {0}".format(position), "unit_price": 9.9}
+                    for position in range(5)
+                ],
+            }
+            for index in range(records)
+        ]
+        results = pybillomat.Invoice.create_many(
+            conn, arguments_list, workers = WORKERS
+        )
+        count = sum(1 for result in results if result.error is None)
+
+    elif name == "edit":
+        async_results = []
+        for id in range(1, records + 1):
+            invoice = pybillomat.Invoice(conn)
+            invoice.id = id
+            async_results.append(
+                invoice.edit_async(title = u"Edited {0}".format(id))
+            )
+        for async_result in async_results:
+            async_result.get()
+        count = len(async_results)
+
+    else:
+        raise ValueError("Unknown scenario: {0}".format(name))
+
+    duration = time.time() - start
+    conn.close()
+
+    return {
+        "scenario": name,
+        "objects": count,
+        "requests": len(conn.latencies),
+        "seconds": duration,
+        "objects_per_second": count / duration if duration else 0.0,
+        "p50_ms": percentile(conn.latencies, 50) * 1000,
+        "p99_ms": percentile(conn.latencies, 99) * 1000,
+        # Linux: kilobytes
+        "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description = __doc__.strip().splitlines()[0])
+    parser.add_argument("--records", type = int, default = 2000)
+    parser.add_argument("--latency", type = float, default = 0.002)
+    parser.add_argument("--scenario", help = "(internal) run one scenario")
+    parser.add_argument("--url", help = "(internal) URL of the server")
+    args = parser.parse_args()
+
+    # Child process: one scenario
+    if args.scenario:
+        result = run_scenario(args.scenario, args.url, args.records)
+        sys.stdout.write(json.dumps(result))
+        return
+
+    # Start server
+    server = subprocess.Popen(
+        [
+            sys.executable, os.path.join(THISDIR, "fake_billomat_server.py"),
+            "--records", str(args.records),
+            "--latency", str(args.latency),
+        ],
+        stdout = subprocess.PIPE
+    )
+    try:
+        url = server.stdout.readline().strip()
+
+        print "Records: {0}, server latency: {1} s, workers: {2}".format(
+            args.records, args.latency, WORKERS
+        )
+        print "{0:<18} {1:>9} {2:>9} {3:>10} {4:>9} {5:>9} {6:>10}".format(
+            "scenario", "objects", "requests", "objects/s",
+            "p50 ms", "p99 ms", "RSS MB"
+        )
+        for name in SCENARIOS:
+            output = subprocess.check_output([
+                sys.executable, os.path.abspath(__file__),
+                "--scenario", name,
+                "--url", url,
+                "--records", str(args.records),
+            ])
+            result = json.loads(output)
+            print (
+                "{scenario:<18} {objects:>9} {requests:>9} "
+                "{objects_per_second:>10.0f} {p50_ms:>9.2f} {p99_ms:>9.2f} "
+                "{peak_rss_mb:>10.1f}"
+            ).format(**result)
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+# coding: utf-8
+"""
+Benchmark: Import time of *pybillomat* with lazy imports
+
+Every variant is measured in new interpreter processes:
+
+- lazy: ``import pybillomat``
+- invoice_client: ``import pybillomat`` and access to *Invoice*
+  and *Client* (typical CLI tool)
+- eager: ``import pybillomat`` and import of every submodule
+  (same work as the former, eager *__init__.py*)
+
+Every variant is measured twice: In a new interpreter and with *munch*
+already imported. *munch* imports *pkg_resources*, which costs more than
+the package itself; applications with other users of *pkg_resources*
+only pay for the package.
+
+Usage::
+
+    python development/benchmark_import.py [runs]
+"""
+
+import os
+import subprocess
+import sys
+
+THISDIR = os.path.dirname(os.path.abspath(__file__))
+APPDIR = os.path.abspath(os.path.join(THISDIR, os.path.pardir))
+
+
+VARIANTS = [
+    ("lazy", "import pybillomat"),
+    (
+        "invoice_client",
+        "import pybillomat; pybillomat.Invoice; pybillomat.Client"
+    ),
+    (
+        "eager",
+        "import importlib, pkgutil, pybillomat\n"
+        "for loader, module, is_package in pkgutil.iter_modules(pybillomat.__path__):\n"
+        "    importlib.import_module('pybillomat.' + module)"
+    ),
+]
+
+SETUPS = [
+    ("new interpreter", ""),
+    ("munch preloaded", "import munch"),
+]
+
+MEASURE_CODE = """
+import sys, time
+sys.path.insert(0, {appdir!r})
+{setup}
+start = time.time()
+{code}
+sys.stdout.write(repr(time.time() - start))
+"""
+
+
+def measure(code, setup = ""):
+    """
+    Returns the import time of *code* in seconds (new process);
+    *setup* is executed before the measurement
+    """
+
+    output = subprocess.check_output([
+        sys.executable, "-c",
+        MEASURE_CODE.format(appdir = APPDIR, setup = setup, code = code)
+    ])
+    return float(output)
+
+
+def median(values):
+    values = sorted(values)
+    return values[len(values) // 2]
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 21
+
+    print "Runs per variant:", runs
+    for setup_name, setup in SETUPS:
+        results = {}
+        for name, code in VARIANTS:
+            results[name] = median([measure(code, setup) for _ in range(runs)])
+
+        print
+        print setup_name.capitalize() + ":"
+        for name, code in VARIANTS:
+            print "  {0:<15} {1:7.1f} ms".format(name + ":", results[name] * 1000)
+        print "  Speedup (lazy):           {0:.1f}x".format(
+            results["eager"] / results["lazy"]
+        )
+        print "  Speedup (invoice_client): {0:.1f}x".format(
+            results["eager"] / results["invoice_client"]
+        )
+
+
+if __name__ == "__main__":
+    main()
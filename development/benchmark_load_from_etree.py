@@ -0,0 +1,127 @@
+#!/usr/bin/env python
+# coding: utf-8
+"""
+Benchmark: *Item.load_from_etree* with decoder table against the former
+implementation with type dispatch per element.
+
+Usage::
+
+    python development/benchmark_load_from_etree.py [count]
+"""
+
+# BEGIN --- required only for testing, remove in real world code --- BEGIN
+import os
+import sys
+THISDIR = os.path.dirname(os.path.abspath(__file__))
+APPDIR = os.path.abspath(os.path.join(THISDIR, os.path.pardir))
+sys.path.insert(0, APPDIR)
+# END --- required only for testing, remove in real world code --- END
+
+import datetime
+import time
+import xml.etree.ElementTree as ET
+import pybillomat
+
+
+INVOICE_ITEM_XML = u"""<invoice-item>
+    <id type="integer">{id}</id>
+    <article_id type="integer">1234</article_id>
+    <invoice_id type="integer">{invoice_id}</invoice_id>
+    <position type="integer">1</position>
+    <unit>Stück</unit>
+    <quantity type="float">2.5</quantity>
+    <unit_price type="float">19.90</unit_price>
+    <tax_name>MwSt</tax_name>
+    <tax_rate type="float">20.0</tax_rate>
+    <title>Position {id}</title>
+    <description>Beschreibung der Position mit Umlauten ÄÖÜ</description>
+    <total_gross type="float">59.70</total_gross>
+    <total_net type="float">49.75</total_net>
+    <reduction></reduction>
+    <total_gross_unreduced type="float">59.70</total_gross_unreduced>
+    <total_net_unreduced type="float">49.75</total_net_unreduced>
+    <created type="datetime">2016-10-04T17:40:00+02:00</created>
+    <date type="date">2016-10-14</date>
+</invoice-item>"""
+
+
+def load_from_etree_former(self, etree_element):
+    """
+    Former implementation of *Item.load_from_etree*
+    """
+
+    for item in etree_element:
+
+        # Get data
+        isinstance(item, ET.Element)
+        tag = item.tag
+        type = item.attrib.get("type")
+        text = item.text
+
+        if text is not None:
+            if type == "integer":
+                setattr(self, tag, int(text))
+            elif type == "datetime":
+                dt = datetime.datetime.strptime(text[:19], "%Y-%m-%dT%H:%M:%S")
+                setattr(self, tag, dt)
+            elif type == "date":
+                d = datetime.date(*[int(item)for item in text.strip().split("-")])
+                setattr(self, tag, d)
+            elif type == "float":
+                setattr(self, tag, float(text))
+            else:
+                if isinstance(text, str):
+                    text = text.decode("utf-8")
+                setattr(self, tag, text)
+
+
+def create_etree_elements(count):
+    xml = u"<invoice-items>{items}</invoice-items>".format(
+        items = u"".join(
+            INVOICE_ITEM_XML.format(id = id, invoice_id = id // 10)
+            for id in range(1, count + 1)
+        )
+    )
+    return list(ET.fromstring(xml.encode("utf-8")))
+
+
+def measure(load_function, etree_elements):
+    """
+    Measures only the loading; the objects are created before
+    """
+
+    result = [pybillomat.InvoiceItem(conn = None) for _ in etree_elements]
+    start = time.time()
+    for invoice_item, etree_element in zip(result, etree_elements):
+        load_function(invoice_item, etree_element)
+    return time.time() - start, result
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    etree_elements = create_etree_elements(count)
+
+    former_seconds, former_result = measure(
+        load_from_etree_former, etree_elements
+    )
+    current_seconds, current_result = measure(
+        pybillomat.InvoiceItem.load_from_etree, etree_elements
+    )
+
+    # Both implementations must produce the same objects
+    for former_item, current_item in zip(former_result, current_result):
+        assert former_item == current_item
+        assert former_item.id == current_item.id
+
+    print "Invoice-items:", count
+    print "Former:  {0:.3f} s ({1:.0f} objects/s)".format(
+        former_seconds, count / former_seconds
+    )
+    print "Current: {0:.3f} s ({1:.0f} objects/s)".format(
+        current_seconds, count / current_seconds
+    )
+    print "Speedup: {0:.2f}x".format(former_seconds / current_seconds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python
+# coding: utf-8
+"""
+Benchmark: Iteration and parsing with a replayed cassette (no network I/O)
+
+Without *--cassette* the invoices of the fake Billomat server are recorded
+into a temporary cassette first. With *--cassette* an existing cassette
+(e.g. recorded with production data) is used; it must contain the
+requests of ``InvoicesIterator(conn, per_page = 100)`` for
+``search(status = "DRAFT")``.
+
+Usage::
+
+    python development/benchmark_replay.py [--cassette FILE] [--runs N]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+THISDIR = os.path.dirname(os.path.abspath(__file__))
+APPDIR = os.path.abspath(os.path.join(THISDIR, os.path.pardir))
+sys.path.insert(0, APPDIR)
+
+import pybillomat
+from pybillomat.invoices import InvoicesIterator
+from fake_billomat_server import FakeBillomatServer
+
+
+def iterate(conn, records = False):
+    iterator = InvoicesIterator(conn, per_page = 100)
+    iterator.records = records
+    iterator.search(status = "DRAFT")
+    return sum(1 for invoice in iterator)
+
+
+def record(filename, record_count):
+    server = FakeBillomatServer(record_count = record_count)
+    server.start()
+    try:
+        cassette = pybillomat.Cassette(filename, mode = "record")
+        conn = pybillomat.Connection(
+            "fake", "fake", base_url = server.url, cassette = cassette
+        )
+        iterate(conn)
+        cassette.close()
+    finally:
+        server.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description = __doc__.strip().splitlines()[0])
+    parser.add_argument("--cassette")
+    parser.add_argument("--records", type = int, default = 5000)
+    parser.add_argument("--runs", type = int, default = 5)
+    args = parser.parse_args()
+
+    filename = args.cassette
+    if not filename:
+        file_descriptor, filename = tempfile.mkstemp(suffix = ".jsonl.gz")
+        os.close(file_descriptor)
+        record(filename, args.records)
+
+    print "Cassette: {0} ({1} bytes)".format(filename, os.path.getsize(filename))
+    for records in (False, True):
+        durations = []
+        for _ in range(args.runs):
+            cassette = pybillomat.Cassette(filename)
+            conn = pybillomat.Connection("fake", "fake", cassette = cassette)
+            start = time.time()
+            count = iterate(conn, records = records)
+            durations.append(time.time() - start)
+        best = min(durations)
+        print "{0:<8} {1} objects, best of {2}: {3:.3f} s ({4:.0f} objects/s)".format(
+            "records" if records else "items",
+            count, args.runs, best, count / best
+        )
+
+    if not args.cassette:
+        os.remove(filename)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,480 @@
+#!/usr/bin/env python
+# coding: utf-8
+"""
+Fake Billomat server for offline tests and benchmarks
+
+Serves generated invoices, clients, invoice-items, invoice-payments, ...
+in the XML-format of the Billomat API. Lists can be paged; creating,
+editing, completing and deleting is accepted and answered like Billomat.
+
+Usage::
+
+    python development/fake_billomat_server.py [--port 8080]
+        [--latency 0.01] [--records 1000] [--children 5]
+
+The URL of the server is printed as first line. Connect with::
+
+    conn = pybillomat.Connection(
+        billomat_id = "fake",
+        billomat_api_key = "fake",
+        base_url = "http://127.0.0.1:8080/"
+    )
+"""
+
+import argparse
+import BaseHTTPServer
+import datetime
+import gzip
+import re
+import SocketServer
+import StringIO
+import sys
+import threading
+import time
+import urlparse
+import xml.etree.ElementTree as ET
+
+
+# Field definitions: (name, type); type None = string
+INVOICE_FIELDS = [
+    ("id", "integer"),
+    ("client_id", "integer"),
+    ("contact_id", "integer"),
+    ("created", "datetime"),
+    ("invoice_number", None),
+    ("number", "integer"),
+    ("number_pre", None),
+    ("status", None),
+    ("date", "date"),
+    ("due_date", "date"),
+    ("due_days", "integer"),
+    ("address", None),
+    ("discount_rate", "float"),
+    ("title", None),
+    ("label", None),
+    ("intro", None),
+    ("note", None),
+    ("total_gross", "float"),
+    ("total_net", "float"),
+    ("net_gross", None),
+    ("paid_amount", "float"),
+    ("open_amount", "float"),
+    ("currency_code", None),
+    ("quote", "float"),
+]
+
+CLIENT_FIELDS = [
+    ("id", "integer"),
+    ("created", "datetime"),
+    ("archived", "integer"),
+    ("client_number", None),
+    ("number", "integer"),
+    ("name", None),
+    ("street", None),
+    ("zip", None),
+    ("city", None),
+    ("country_code", None),
+    ("first_name", None),
+    ("last_name", None),
+    ("email", None),
+    ("phone", None),
+    ("currency_code", None),
+    ("locale", None),
+    ("note", None),
+]
+
+INVOICE_ITEM_FIELDS = [
+    ("id", "integer"),
+    ("article_id", "integer"),
+    ("invoice_id", "integer"),
+    ("position", "integer"),
+    ("unit", None),
+    ("quantity", "float"),
+    ("unit_price", "float"),
+    ("tax_name", None),
+    ("tax_rate", "float"),
+    ("title", None),
+    ("description", None),
+    ("total_gross", "float"),
+    ("total_net", "float"),
+]
+
+INVOICE_PAYMENT_FIELDS = [
+    ("id", "integer"),
+    ("created", "datetime"),
+    ("invoice_id", "integer"),
+    ("user_id", "integer"),
+    ("date", "date"),
+    ("amount", "float"),
+    ("comment", None),
+    ("type", None),
+]
+
+ARTICLE_FIELDS = [
+    ("id", "integer"),
+    ("created", "datetime"),
+    ("article_number", None),
+    ("number", "integer"),
+    ("title", None),
+    ("description", None),
+    ("sales_price", "float"),
+    ("currency_code", None),
+    ("unit_id", "integer"),
+    ("tax_id", "integer"),
+]
+
+CONTACT_FIELDS = [
+    ("id", "integer"),
+    ("client_id", "integer"),
+    ("created", "datetime"),
+    ("name", None),
+    ("first_name", None),
+    ("last_name", None),
+    ("email", None),
+    ("phone", None),
+]
+
+DOCUMENT_FIELDS = [
+    ("id", "integer"),
+    ("client_id", "integer"),
+    ("created", "datetime"),
+    ("number", "integer"),
+    ("status", None),
+    ("date", "date"),
+    ("title", None),
+    ("total_gross", "float"),
+    ("total_net", "float"),
+]
+
+# Path --> (item-tag, fields, filter of the parent object)
+RESOURCES = {
+    "invoices": ("invoice", INVOICE_FIELDS, None),
+    "clients": ("client", CLIENT_FIELDS, None),
+    "articles": ("article", ARTICLE_FIELDS, None),
+    "suppliers": ("supplier", CLIENT_FIELDS, None),
+    "credit-notes": ("credit-note", DOCUMENT_FIELDS, None),
+    "reminders": ("reminder", DOCUMENT_FIELDS, None),
+    "recurrings": ("recurring", DOCUMENT_FIELDS, None),
+    "invoice-items": ("invoice-item", INVOICE_ITEM_FIELDS, "invoice_id"),
+    "invoice-payments": ("invoice-payment", INVOICE_PAYMENT_FIELDS, "invoice_id"),
+    "credit-note-items": ("credit-note-item", INVOICE_ITEM_FIELDS, "credit_note_id"),
+    "recurring-items": ("recurring-item", INVOICE_ITEM_FIELDS, "recurring_id"),
+    "reminder-items": ("reminder-item", INVOICE_ITEM_FIELDS, "reminder_id"),
+    "contacts": ("contact", CONTACT_FIELDS, "client_id"),
+}
+
+START_DATE = datetime.date(2016, 1, 1)
+START_DATETIME = datetime.datetime(2016, 1, 1, 8, 0, 0)
+
+# /api/<resource>[/<id>[/<action>]]
+PATH_PATTERN = re.compile(r"^/api/([a-z-]+)(?:/(\d+))?(?:/([a-z]+))?/?$")
+
+
+def _field_value(name, type, id):
+    """
+    Returns a deterministic value for one field of an object
+    """
+
+    if name == "id":
+        return str(id)
+    if type == "integer":
+        return str(id % 1000 + 1)
+    if type == "float":
+        return "{0:.2f}".format((id % 997) * 1.5 + 0.99)
+    if type == "date":
+        return (START_DATE + datetime.timedelta(days = id % 365)).isoformat()
+    if type == "datetime":
+        value = START_DATETIME + datetime.timedelta(minutes = id)
+        return value.isoformat() + "+01:00"
+    if name == "status":
+        return "DRAFT" if id % 3 else "PAID"
+    return u"{name} {id} äöü".format(name = name.capitalize(), id = id)
+
+
+def _item_element(tag, fields, id, parent_id = None, parent_field = None):
+    """
+    Creates the XML-element of one object
+    """
+
+    item_tag = ET.Element(tag)
+    for name, type in fields:
+        field_tag = ET.SubElement(item_tag, name)
+        if type:
+            field_tag.set("type", type)
+        if name == parent_field:
+            field_tag.text = str(parent_id)
+        else:
+            field_tag.text = _field_value(name, type, id)
+    return item_tag
+
+
+class FakeBillomatServer(SocketServer.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    """
+    Threaded HTTP-server with the configuration of the fake data
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+    def __init__(
+        self,
+        port = 0,
+        latency_seconds = 0.0,
+        record_count = 1000,
+        children_per_parent = 5,
+        max_per_page = 1000
+    ):
+        """
+        :param port: TCP-port; 0 = free port
+        :param latency_seconds: Delay of every response
+        :param record_count: Count of objects of every main resource
+            (invoices, clients, articles, ...)
+        :param children_per_parent: Count of items, payments or contacts
+            per invoice or client
+        :param max_per_page: Maximum page size
+        """
+
+        BaseHTTPServer.HTTPServer.__init__(
+            self, ("127.0.0.1", port), FakeBillomatRequestHandler
+        )
+        self.latency_seconds = latency_seconds
+        self.record_count = record_count
+        self.children_per_parent = children_per_parent
+        self.max_per_page = max_per_page
+        self.next_id = record_count * 1000
+        self.request_count = 0
+        self._lock = threading.Lock()
+        self._thread = None
+
+
+    @property
+    def url(self):
+        return "http://127.0.0.1:{port}/".format(port = self.server_address[1])
+
+
+    def get_next_id(self):
+        with self._lock:
+            self.next_id += 1
+            return self.next_id
+
+
+    def start(self):
+        """
+        Starts the server in a background thread
+        """
+
+        self._thread = threading.Thread(target = self.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+class FakeBillomatRequestHandler(BaseHTTPServer.BaseHTTPRequestHandler):
+
+    protocol_version = "HTTP/1.1"
+
+    # Headers and body in one packet (no delayed ACK between them)
+    wbufsize = -1
+    disable_nagle_algorithm = True
+
+
+    def log_message(self, format, *args):
+        pass
+
+
+    def _send_xml(self, status, xml):
+        """
+        Sends the XML (gzipped, if accepted)
+        """
+
+        if isinstance(xml, unicode):
+            xml = xml.encode("utf-8")
+        if not isinstance(xml, str):
+            xml = ET.tostring(xml, encoding = "utf-8")
+
+        headers = [("Content-Type", "application/xml")]
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            buffer = StringIO.StringIO()
+            with gzip.GzipFile(fileobj = buffer, mode = "wb") as gzip_file:
+                gzip_file.write(xml)
+            xml = buffer.getvalue()
+            headers.append(("Content-Encoding", "gzip"))
+
+        self.send_response(status)
+        for name, value in headers:
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(xml)))
+        self.end_headers()
+        self.wfile.write(xml)
+
+
+    def _send_error(self, status, text):
+        self._send_xml(
+            status, "<errors><error>{text}</error></errors>".format(text = text)
+        )
+
+
+    def _read_body(self):
+        length = int(self.headers.get("Content-Length", "0"))
+        body = self.rfile.read(length) if length else ""
+        if self.headers.get("Content-Encoding") == "gzip" and body:
+            body = gzip.GzipFile(fileobj = StringIO.StringIO(body)).read()
+        return body
+
+
+    def _prepare(self):
+        """
+        Waits *latency_seconds* and parses the path
+
+        :returns: (resource, id, action, query) or `None`
+        """
+
+        server = self.server
+        with server._lock:
+            server.request_count += 1
+        if server.latency_seconds:
+            time.sleep(server.latency_seconds)
+
+        path, _, query_string = self.path.partition("?")
+        match = PATH_PATTERN.match(path)
+        if not match or match.group(1) not in RESOURCES:
+            self._send_error(404, "Not found")
+            return
+        resource, id, action = match.groups()
+        query = dict(urlparse.parse_qsl(query_string))
+        return resource, (int(id) if id else None), action, query
+
+
+    def do_GET(self):
+        prepared = self._prepare()
+        if prepared is None:
+            return
+        resource, id, action, query = prepared
+        tag, fields, parent_field = RESOURCES[resource]
+        server = self.server
+
+        # One object
+        if id is not None:
+            if parent_field:
+                parent_id = id // 100
+                exists = 0 < id % 100 <= server.children_per_parent
+            else:
+                parent_id = None
+                exists = 0 < id <= server.record_count
+            if not exists:
+                return self._send_error(404, "Row not found")
+            return self._send_xml(200, _item_element(
+                tag, fields, id, parent_id = parent_id, parent_field = parent_field
+            ))
+
+        # List: ids of all found objects
+        if parent_field:
+            if parent_field in query:
+                parent_ids = [
+                    int(parent_id)
+                    for parent_id in query[parent_field].split(",")
+                    if parent_id.strip()
+                ]
+            else:
+                # No filter: children of all parents
+                parent_ids = range(1, server.record_count + 1)
+            ids = [
+                (parent_id, parent_id * 100 + position)
+                for parent_id in parent_ids
+                for position in range(1, server.children_per_parent + 1)
+            ]
+        else:
+            ids = [(None, id) for id in range(1, server.record_count + 1)]
+        if query.get("order_by", "").upper().endswith("DESC"):
+            ids.reverse()
+
+        # Page
+        per_page = min(int(query.get("per_page", 100)), server.max_per_page)
+        page = int(query.get("page", 1))
+        page_ids = ids[(page - 1) * per_page:page * per_page]
+
+        root_tag = ET.Element(resource)
+        root_tag.set("page", str(page))
+        root_tag.set("per_page", str(per_page))
+        root_tag.set("total", str(len(ids)))
+        for parent_id, id in page_ids:
+            root_tag.append(_item_element(
+                tag, fields, id, parent_id = parent_id, parent_field = parent_field
+            ))
+        self._send_xml(200, root_tag)
+
+
+    def do_POST(self):
+        prepared = self._prepare()
+        if prepared is None:
+            return
+        resource, id, action, query = prepared
+        body = self._read_body()
+
+        # Action (e.g. /api/invoices/1/email)
+        if id is not None:
+            return self._send_xml(200, "<{0}/>".format(action or "ok"))
+
+        # Create: return the posted object with id
+        try:
+            item_tag = ET.fromstring(body)
+        except ET.ParseError:
+            return self._send_error(400, "Invalid XML")
+        id_tag = ET.Element("id", type = "integer")
+        id_tag.text = str(self.server.get_next_id())
+        item_tag.insert(0, id_tag)
+        self._send_xml(201, item_tag)
+
+
+    def do_PUT(self):
+        prepared = self._prepare()
+        if prepared is None:
+            return
+        resource, id, action, query = prepared
+        body = self._read_body()
+        if id is None:
+            return self._send_error(404, "Not found")
+        if action:
+            return self._send_xml(200, "<{0}/>".format(action))
+        self._send_xml(200, body or "<{0}/>".format(RESOURCES[resource][0]))
+
+
+    def do_DELETE(self):
+        prepared = self._prepare()
+        if prepared is None:
+            return
+        self._read_body()
+        self._send_xml(200, "<ok/>")
+
+
+def main():
+    parser = argparse.ArgumentParser(description = "Fake Billomat server")
+    parser.add_argument("--port", type = int, default = 0)
+    parser.add_argument("--latency", type = float, default = 0.0)
+    parser.add_argument("--records", type = int, default = 1000)
+    parser.add_argument("--children", type = int, default = 5)
+    parser.add_argument("--max-per-page", type = int, default = 1000)
+    args = parser.parse_args()
+
+    server = FakeBillomatServer(
+        port = args.port,
+        latency_seconds = args.latency,
+        record_count = args.records,
+        children_per_parent = args.children,
+        max_per_page = args.max_per_page
+    )
+    print server.url
+    sys.stdout.flush()
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -42,10 +42,17 @@ invoices_iterator = pybillomat.InvoicesIterator(conn = conn)
 invoices_iterator.search(status = "DRAFT")
 print "Found :", len(invoices_iterator)
 
-# Complete all DRAFT-invoices
-for invoice in invoices_iterator:
-    assert isinstance(invoice, pybillomat.Invoice)
-    invoice.complete()
+# Complete all DRAFT-invoices (4 at the same time); the finished invoices
+# are written into the checkpoint file, so the job can be resumed
+bulk_job = pybillomat.BulkDocumentJob(
+    complete = True,
+    send = False,
+    workers = 4,
+    checkpoint_filename = "complete_invoices.checkpoint"
+)
+for result in bulk_job.run(list(invoices_iterator)):
+    if result.error:
+        print "Error:", result.id, result.error
 
 # Search remaining DRAFT-invoices
 invoices_iterator.search(status = "DRAFT")
@@ -2,102 +2,192 @@
 # coding: utf-8
 """
 Python-Billomat - Billomat API Client Library
+
+The public names (*Connection*, *Invoice*, *ClientsIterator*, ...) are
+imported lazily on first access. So ``import pybillomat`` doesn't import
+all resource modules, *urllib3* and *munch*.
+Benchmark: *development/benchmark_import.py*
 """
 
-from http import Connection
-from clients import (
-    Client,
-    ClientsIterator
-)
-from contacts import (
-    Contact,
-    ContactsIterator
-)
-from invoices import (
-    Invoice,
-    InvoicesIterator
-)
-from invoice_items import (
-    InvoiceItem,
-    InvoiceItemsIterator
-)
-from invoice_payments import (
-    InvoicePayment,
-    InvoicePaymentsIterator
-)
-from invoice_tags import (
-    InvoiceTag,
-    InvoiceTagsIterator
-)
-from client_properties import (
-    ClientProperty,
-    ClientPropertiesIterator
-)
-from client_tags import (
-    ClientTag,
-    ClientTagsIterator
-)
-from articles import (
-    Article,
-    ArticlesIterator
-)
-from article_properties import (
-    ArticleProperty,
-    ArticlePropertiesIterator
-)
-from article_tags import (
-    ArticleTag,
-    ArticleTagsIterator
-)
-from recurrings import (
-    Recurring,
-    RecurringsIterator
-)
-from recurring_items import (
-    RecurringItem,
-    RecurringItemsIterator
-)
-from recurring_tags import (
-    RecurringTag,
-    RecurringTagsIterator
-)
-from recurring_email_receivers import (
-    RecurringEmailReceiver,
-    RecurringEmailReceiversIterator
-)
-from email_templates import (
-    EmailTemplate,
-    EmailTemplatesIterator
-)
-from reminders import (
-    Reminder,
-    RemindersIterator
-)
-from reminder_items import (
-    ReminderItem,
-    ReminderItemsIterator
-)
-from reminder_tags import (
-    ReminderTag,
-    ReminderTagsIterator
-)
-from reminder_texts import (
-    ReminderText,
-    ReminderTextsIterator
-)
-from suppliers import (
-    Supplier,
-    SuppliersIterator
-)
-from credit_notes import (
-    CreditNote,
-    CreditNotesIterator
-)
-from credit_note_items import (
-    CreditNoteItem,
-    CreditNoteItemsIterator
-)
-from credit_note_tags import (
-    CreditNoteTag,
-    CreditNoteTagsIterator
+import importlib
+import sys
+import types
+
+
+# Module --> public names
+_EXPORTS = {
+    "http": (
+        "Connection",
+        "AsyncConnection",
+    ),
+    "response_cache": (
+        "MemoryResponseCache",
+        "DiskResponseCache",
+    ),
+    "identity_map": (
+        "IdentityMap",
+    ),
+    "cassette": (
+        "Cassette",
+    ),
+    "metrics": (
+        "EndpointMetrics",
+    ),
+    "mirror": (
+        "SQLiteMirror",
+    ),
+    "client_index": (
+        "ClientIndex",
+    ),
+    "clients": (
+        "Client",
+        "ClientsIterator",
+    ),
+    "contacts": (
+        "Contact",
+        "ContactsIterator",
+    ),
+    "invoices": (
+        "Invoice",
+        "InvoicesIterator",
+    ),
+    "invoice_items": (
+        "InvoiceItem",
+        "InvoiceItemsIterator",
+    ),
+    "invoice_payments": (
+        "InvoicePayment",
+        "InvoicePaymentsIterator",
+    ),
+    "invoice_tags": (
+        "InvoiceTag",
+        "InvoiceTagsIterator",
+    ),
+    "client_properties": (
+        "ClientProperty",
+        "ClientPropertiesIterator",
+    ),
+    "client_tags": (
+        "ClientTag",
+        "ClientTagsIterator",
+    ),
+    "articles": (
+        "Article",
+        "ArticlesIterator",
+    ),
+    "article_properties": (
+        "ArticleProperty",
+        "ArticlePropertiesIterator",
+    ),
+    "article_tags": (
+        "ArticleTag",
+        "ArticleTagsIterator",
+    ),
+    "recurrings": (
+        "Recurring",
+        "RecurringsIterator",
+    ),
+    "recurring_items": (
+        "RecurringItem",
+        "RecurringItemsIterator",
+    ),
+    "recurring_tags": (
+        "RecurringTag",
+        "RecurringTagsIterator",
+    ),
+    "recurring_email_receivers": (
+        "RecurringEmailReceiver",
+        "RecurringEmailReceiversIterator",
+    ),
+    "email_templates": (
+        "EmailTemplate",
+        "EmailTemplatesIterator",
+    ),
+    "reminders": (
+        "Reminder",
+        "RemindersIterator",
+    ),
+    "reminder_items": (
+        "ReminderItem",
+        "ReminderItemsIterator",
+    ),
+    "reminder_tags": (
+        "ReminderTag",
+        "ReminderTagsIterator",
+    ),
+    "reminder_texts": (
+        "ReminderText",
+        "ReminderTextsIterator",
+    ),
+    "suppliers": (
+        "Supplier",
+        "SuppliersIterator",
+    ),
+    "credit_notes": (
+        "CreditNote",
+        "CreditNotesIterator",
+    ),
+    "credit_note_items": (
+        "CreditNoteItem",
+        "CreditNoteItemsIterator",
+    ),
+    "credit_note_tags": (
+        "CreditNoteTag",
+        "CreditNoteTagsIterator",
+    ),
+    "bulk": (
+        "BulkDocumentJob",
+    ),
+}
+
+# Public name --> module
+_EXPORT_MODULES = dict(
+    (name, module_name)
+    for module_name, names in _EXPORTS.items()
+    for name in names
 )
+
+
+class _LazyModule(types.ModuleType):
+    """
+    Package module, which imports the public names on first access
+    """
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+        module_name = _EXPORT_MODULES.get(name)
+        if module_name is None:
+            # Submodule, e.g. "pybillomat.errors"
+            try:
+                return importlib.import_module(self.__name__ + "." + name)
+            except ImportError:
+                raise AttributeError(
+                    "'module' object has no attribute '{name}'".format(
+                        name = name
+                    )
+                )
+
+        # Import module and keep the public name
+        module = importlib.import_module(self.__name__ + "." + module_name)
+        value = getattr(module, name)
+        setattr(self, name, value)
+        return value
+
+
+    def __dir__(self):
+        return sorted(set(self.__dict__) | set(_EXPORT_MODULES))
+
+
+# Replace this module with the lazy module
+_lazy_module = _LazyModule(__name__, __doc__)
+_lazy_module.__dict__.update(
+    (name, value) for name, value in globals().items()
+    if name.startswith("__")
+)
+_lazy_module.__all__ = sorted(_EXPORT_MODULES)
+# Python 2 clears the globals of a module when it is deleted;
+# the functions of *_LazyModule* still need them.
+_lazy_module._original_module = sys.modules[__name__]
+sys.modules[__name__] = _lazy_module
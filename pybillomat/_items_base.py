@@ -1,10 +1,250 @@
 #!/usr/bin/env python
 # coding: utf-8
 
+import collections
+import copy
 import datetime
 import errors
+import functools
+import itertools
+import threading
+import time
 import xml.etree.ElementTree as ET
+from multiprocessing.pool import ThreadPool
 from munch import Munch as Bunch
+from http import Url
+
+try:
+    # C-implementation (about six times faster than *ET.iterparse*)
+    from xml.etree.cElementTree import iterparse, ParseError as IterParseError
+except ImportError:
+    from xml.etree.ElementTree import iterparse, ParseError as IterParseError
+
+try:
+    from urllib3.exceptions import DecodeError
+except ImportError:
+    # Google App Engine
+    class DecodeError(Exception):
+        pass
+
+
+def _import_numpy():
+    """
+    Imports NumPy on first use (NumPy is optional and slow to import)
+
+    :returns: numpy-module or `None`, if NumPy is not installed
+    """
+
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _iter_concurrent(function, arguments, workers):
+    """
+    Calls *function* for every argument in *workers* threads and
+    yields the results in the order of the arguments
+
+    Not more than *workers* calls are running ahead of the consumer.
+    """
+
+    arguments = iter(arguments)
+    pool = ThreadPool(processes = workers)
+    pending = collections.deque()
+
+    try:
+        for argument in itertools.islice(arguments, workers):
+            pending.append(pool.apply_async(function, (argument,)))
+        while pending:
+            result = pending.popleft().get()
+            for argument in itertools.islice(arguments, 1):
+                pending.append(pool.apply_async(function, (argument,)))
+            yield result
+    finally:
+        pool.terminate()
+
+
+def _decode_string(text):
+    """
+    <name>Text</name>
+    """
+
+    if isinstance(text, str):
+        text = text.decode("utf-8")
+    return text
+
+
+def _decode_date(text):
+    """
+    <date type="date">2009-10-14</date>
+    """
+
+    if len(text) == 10 and text[4] == "-" and text[7] == "-":
+        return datetime.date(int(text[0:4]), int(text[5:7]), int(text[8:10]))
+    return datetime.date(*[int(item) for item in text.strip().split("-")])
+
+
+def _decode_datetime(text):
+    """
+    <created type="datetime">2011-10-04T17:40:00+02:00</created>
+
+    The timezone is ignored.
+    """
+
+    if (
+        len(text) >= 19 and
+        text[4] == "-" and text[7] == "-" and text[10] == "T" and
+        text[13] == ":" and text[16] == ":"
+    ):
+        return datetime.datetime(
+            int(text[0:4]), int(text[5:7]), int(text[8:10]),
+            int(text[11:13]), int(text[14:16]), int(text[17:19])
+        )
+    return datetime.datetime.strptime(text[:19], "%Y-%m-%dT%H:%M:%S")
+
+
+_FIELD_CONVERTERS = {
+    "integer": int,
+    "float": float,
+    "date": _decode_date,
+    "datetime": _decode_datetime,
+}
+
+# Targets of the field decoders
+_TARGET_KEY = "key"
+_TARGET_ATTRIBUTE = "attribute"
+_TARGET_SETATTR = "setattr"
+
+
+def _get_page_url(url, page):
+    """
+    Returns a copy of the search-url with another page
+    """
+
+    return Url(path = url.path, query = dict(url.query, page = page))
+
+
+class _ColumnCollector(object):
+    """
+    Collects the values of some fields of many XML-elements in columns
+    """
+
+    def __init__(self, item_class, field_names):
+        self.item_class = item_class
+        self.field_names = list(field_names)
+        self.columns = dict((field_name, []) for field_name in self.field_names)
+        self.field_types = {}
+        self.count = 0
+
+
+    def add(self, etree_element):
+        """
+        Adds the values of one XML-element
+        """
+
+        field_decoders = self.item_class._get_field_decoders()
+        values = {}
+
+        for item in etree_element:
+            text = item.text
+            if text is None or item.tag not in self.columns:
+                continue
+            type = item.get("type")
+            try:
+                target, converter = field_decoders[(item.tag, type)]
+            except KeyError:
+                target, converter = self.item_class._add_field_decoder(item.tag, type)
+            values[item.tag] = converter(text)
+            if type and item.tag not in self.field_types:
+                self.field_types[item.tag] = type
+
+        for field_name, column in self.columns.iteritems():
+            column.append(values.get(field_name))
+        self.count += 1
+
+
+    def extend(self, column_collector):
+        """
+        Appends the columns of another collector
+        """
+
+        for field_name, column in self.columns.iteritems():
+            column.extend(column_collector.columns[field_name])
+        for field_name, type in column_collector.field_types.iteritems():
+            self.field_types.setdefault(field_name, type)
+        self.count += column_collector.count
+
+
+    def get_arrays(self):
+        """
+        Returns the columns as typed NumPy-arrays
+
+        - integer: int64 (float64 with NaN, if values are missing)
+        - float: float64 (NaN for missing values)
+        - date: datetime64[D] (NaT for missing values)
+        - datetime: datetime64[s] (NaT for missing values)
+        - other: object
+        """
+
+        numpy = _import_numpy()
+        arrays = {}
+        for field_name, column in self.columns.iteritems():
+            type = self.field_types.get(field_name)
+            if type == "integer":
+                if None in column:
+                    arrays[field_name] = numpy.array(
+                        [numpy.nan if value is None else value for value in column],
+                        dtype = "float64"
+                    )
+                else:
+                    arrays[field_name] = numpy.array(column, dtype = "int64")
+            elif type == "float":
+                arrays[field_name] = numpy.array(
+                    [numpy.nan if value is None else value for value in column],
+                    dtype = "float64"
+                )
+            elif type == "date":
+                arrays[field_name] = numpy.array(column, dtype = "datetime64[D]")
+            elif type == "datetime":
+                arrays[field_name] = numpy.array(column, dtype = "datetime64[s]")
+            else:
+                arrays[field_name] = numpy.array(column, dtype = "object")
+        return arrays
+
+
+class _ResponseReader(object):
+    """
+    File-like object for *iterparse*
+
+    Reads the body of a streamed urllib3-response chunk by chunk.
+    Responses without *stream*-method (Google App Engine) are read at once.
+    """
+
+    chunk_size = 64 * 1024
+
+
+    def __init__(self, response):
+        self.response = response
+        self.streamed = hasattr(response, "stream")
+        if self.streamed:
+            self.chunks = response.stream(self.chunk_size)
+        else:
+            self.chunks = iter([response.data])
+        self.bytes_read = 0
+
+
+    def read(self, size = -1):
+        for chunk in self.chunks:
+            self.bytes_read += len(chunk)
+            return chunk
+        return ""
+
+
+    def close(self):
+        if hasattr(self.response, "release_conn"):
+            self.response.release_conn()
 
 
 class Item(Bunch):
@@ -20,36 +260,166 @@ class Item(Bunch):
     _customfield_value = None
 
 
+    @classmethod
+    def _get_field_decoders(cls):
+        """
+        Returns the decoder table of the class
+
+        The table maps ``(tag, type)`` to ``(target, converter)``.
+        It is filled once per tag and type, when the tag appears
+        the first time.
+        """
+
+        field_decoders = cls.__dict__.get("_field_decoders")
+        if field_decoders is None:
+            field_decoders = {}
+            cls._field_decoders = field_decoders
+        return field_decoders
+
+
+    @classmethod
+    def _create_field_decoder(cls, tag, type):
+        """
+        Creates the decoder for one XML-element
+
+        The target describes where *Munch.__setattr__* would store
+        the value: As dictionary key, as instance attribute (names which
+        exist in the class, e.g. "id") or with *setattr* (properties).
+        """
+
+        converter = _FIELD_CONVERTERS.get(type, _decode_string)
+
+        class_attribute = getattr(cls, tag, None)
+        if class_attribute is None and not hasattr(cls, tag):
+            target = _TARGET_KEY
+        elif hasattr(class_attribute, "__set__"):
+            target = _TARGET_SETATTR
+        else:
+            target = _TARGET_ATTRIBUTE
+
+        return target, converter
+
+
+    @classmethod
+    def _add_field_decoder(cls, tag, type):
+        """
+        Creates the decoder for one tag and type and adds it
+        to the decoder table
+        """
+
+        field_decoder = cls._create_field_decoder(tag, type)
+        cls._get_field_decoders()[(tag, type)] = field_decoder
+        return field_decoder
+
+
+    @classmethod
+    def get_record_class(cls):
+        """
+        Returns the lightweight record class of this Item-class
+
+        The record class is a namedtuple (immutable, without per-instance
+        dictionary) with the field "id" and all fields of the Item-class.
+        It is generated once per class.
+        """
+
+        record_class = cls.__dict__.get("_record_class")
+        if record_class is None:
+            prototype = cls(conn = None)
+            field_names = ["id"] + sorted(
+                field_name for field_name in prototype
+                if field_name != "conn"
+            )
+            record_class_name = cls.__name__ + "Record"
+            record_class = type(
+                record_class_name,
+                (collections.namedtuple(record_class_name, field_names), ItemRecord),
+                {
+                    "__module__": cls.__module__,
+                    "__slots__": (),
+                    "item_class": cls,
+                    "field_positions": dict(
+                        (field_name, position)
+                        for position, field_name in enumerate(field_names)
+                    ),
+                }
+            )
+            cls._record_class = record_class
+        return record_class
+
+
+    @classmethod
+    def create_record(cls, etree_element):
+        """
+        Creates a lightweight record from Element-Tree
+
+        XML-elements without field in the record class are ignored.
+        """
+
+        record_class = cls.get_record_class()
+        field_positions = record_class.field_positions
+        field_decoders = cls._get_field_decoders()
+        values = [None] * len(field_positions)
+
+        for item in etree_element:
+
+            # Get data
+            text = item.text
+            if text is None:
+                continue
+            position = field_positions.get(item.tag)
+            if position is None:
+                continue
+            type = item.get("type")
+
+            # Decoder
+            try:
+                target, converter = field_decoders[(item.tag, type)]
+            except KeyError:
+                target, converter = cls._add_field_decoder(item.tag, type)
+
+            # Convert
+            values[position] = converter(text)
+
+        return tuple.__new__(record_class, values)
+
+
     def load_from_etree(self, etree_element):
         """
         Loads data from Element-Tree
+
+        The values are converted with the decoder table of the class.
+        Dictionary keys are assigned in bulk.
         """
 
+        field_decoders = self._get_field_decoders()
+        keys = {}
+
         for item in etree_element:
 
             # Get data
-            isinstance(item, ET.Element)
-            tag = item.tag
-            type = item.attrib.get("type")
             text = item.text
+            if text is None:
+                continue
+            tag = item.tag
+            type = item.get("type")
+
+            # Decoder
+            try:
+                target, converter = field_decoders[(tag, type)]
+            except KeyError:
+                target, converter = self._add_field_decoder(tag, type)
+
+            # Convert
+            value = converter(text)
+            if target is _TARGET_KEY:
+                keys[tag] = value
+            elif target is _TARGET_ATTRIBUTE:
+                object.__setattr__(self, tag, value)
+            else:
+                setattr(self, tag, value)
 
-            if text is not None:
-                if type == "integer":
-                    setattr(self, tag, int(text))
-                elif type == "datetime":
-                    # <created type="datetime">2011-10-04T17:40:00+02:00</created>
-                    dt = datetime.datetime.strptime(text[:19], "%Y-%m-%dT%H:%M:%S")
-                    setattr(self, tag, dt)
-                elif type == "date":
-                    # <date type="date">2009-10-14</date>
-                    d = datetime.date(*[int(item)for item in text.strip().split("-")])
-                    setattr(self, tag, d)
-                elif type == "float":
-                    setattr(self, tag, float(text))
-                else:
-                    if isinstance(text, str):
-                        text = text.decode("utf-8")
-                    setattr(self, tag, text)
+        # Assign
+        dict.update(self, keys)
 
 
     def load_from_xml(self, xml_string):
@@ -92,9 +462,59 @@ class Item(Bunch):
         return response
 
 
-    def load(self, id = None):
+    def _get_identity_map(self):
+        """
+        Returns the identity map of the connection or `None`
+        """
+
+        return getattr(self.conn, "identity_map", None)
+
+
+    def _get_identity_fields(self):
+        """
+        Returns a copy of the loaded field values for the identity map
+        """
+
+        fields = dict(self)
+        fields.pop("conn", None)
+        fields["id"] = self.id
+        fields["content_language"] = self.content_language
+        return fields
+
+
+    def _load_identity_fields(self, fields):
+        """
+        Fills in the field values from the identity map
+        """
+
+        fields = dict(fields)
+        object.__setattr__(self, "id", fields.pop("id"))
+        object.__setattr__(
+            self, "content_language", fields.pop("content_language")
+        )
+        dict.update(self, fields)
+
+
+    def _add_to_identity_map(self):
+        """
+        Stores the field values in the identity map of the connection
+        """
+
+        identity_map = self._get_identity_map()
+        if identity_map is not None and self.id is not None:
+            identity_map.set(
+                (self.base_path, self.id), self._get_identity_fields()
+            )
+
+
+    def load(self, id = None, refresh = False):
         """
         Loads the recurring-data from server
+
+        If the connection has an identity map, the data is taken from
+        the identity map if possible.
+
+        :param refresh: If `True`, the data is always loaded from server
         """
 
         # Parameters
@@ -103,13 +523,194 @@ class Item(Bunch):
         if not self.id:
             raise errors.NoIdError()
 
+        # Identity map
+        identity_map = self._get_identity_map()
+        if identity_map is not None and not refresh:
+            fields = identity_map.get((self.base_path, self.id))
+            if fields is not None:
+                self._load_identity_fields(fields)
+                return
+
         # Fetch data
         response = self._get_response()
 
         # Fill in data from XML
+        start = time.time()
         self.load_from_xml(response.data)
+        if getattr(self.conn, "hooks", None):
+            self.conn.report_parse(
+                "{base_path}/{id}".format(base_path = self.base_path, id = self.id),
+                time.time() - start,
+                1
+            )
         self.content_language = response.headers.get("content-language", None)
 
+        # Identity map
+        if identity_map is not None:
+            self._add_to_identity_map()
+
+
+    @classmethod
+    def load_many(cls, conn, ids, workers = 10):
+        """
+        Loads many objects by id
+
+        Objects found in the identity map of the connection are taken
+        from there, the other objects are loaded with concurrent
+        GET-requests (not more than *workers* at the same time).
+        Ids, which the server doesn't find (*NotFoundError*), are mapped
+        to `None`; other errors are raised.
+
+        :param conn: Connection-Object
+        :param ids: Iterable with ids
+        :param workers: Maximum count of concurrent requests
+
+        :returns: Dictionary ``id --> object`` (`None` if not found)
+        """
+
+        result = {}
+        missing_ids = []
+        identity_map = getattr(conn, "identity_map", None)
+
+        for id in ids:
+            if id in result:
+                continue
+            fields = None
+            if identity_map is not None:
+                fields = identity_map.get((cls.base_path, id))
+            if fields is None:
+                missing_ids.append(id)
+                result[id] = None
+            else:
+                item = cls(conn = conn)
+                item._load_identity_fields(fields)
+                result[id] = item
+
+        # Load the missing objects
+        def load(id):
+            try:
+                return id, cls(conn = conn, id = id)
+            except errors.NotFoundError:
+                return id, None
+
+        if workers > 1 and len(missing_ids) > 1:
+            loaded = _iter_concurrent(load, missing_ids, workers)
+        else:
+            loaded = itertools.imap(load, missing_ids)
+        for id, item in loaded:
+            result[id] = item
+
+        return result
+
+
+    def _submit(self, method_name, *args, **kwargs):
+        """
+        Calls the method *method_name* in a thread of the
+        *AsyncConnection* (self.conn)
+
+        :returns: AsyncResult
+        """
+
+        return self.conn.submit(getattr(self, method_name), *args, **kwargs)
+
+
+    def _load_and_return(self, id = None):
+        self.load(id = id)
+        return self
+
+
+    def load_async(self, id = None):
+        """
+        Loads the data from server in the background
+        (needs an *AsyncConnection*)
+
+        :returns: AsyncResult; its *get()* returns the loaded object
+        """
+
+        return self._submit("_load_and_return", id = id)
+
+
+    def edit_async(self, *args, **kwargs):
+        """
+        Calls *edit()* in the background (needs an *AsyncConnection*)
+
+        :returns: AsyncResult
+        """
+
+        return self._submit("edit", *args, **kwargs)
+
+
+    def complete_async(self, *args, **kwargs):
+        """
+        Calls *complete()* in the background (needs an *AsyncConnection*)
+
+        :returns: AsyncResult
+        """
+
+        return self._submit("complete", *args, **kwargs)
+
+
+    def send_async(self, *args, **kwargs):
+        """
+        Calls *send()* in the background (needs an *AsyncConnection*)
+
+        :returns: AsyncResult
+        """
+
+        return self._submit("send", *args, **kwargs)
+
+
+    def delete_async(self, id = None):
+        """
+        Deletes an item in the background (needs an *AsyncConnection*)
+
+        :returns: AsyncResult
+        """
+
+        return self._submit("delete", id = id)
+
+
+    @classmethod
+    def create_async(cls, conn, *args, **kwargs):
+        """
+        Calls *create()* in the background (needs an *AsyncConnection*)
+
+        :returns: AsyncResult; its *get()* returns the new object
+        """
+
+        return conn.submit(cls.create, conn, *args, **kwargs)
+
+
+    @classmethod
+    def create_many(cls, conn, arguments_list, workers = 10):
+        """
+        Creates many objects with concurrent *create()*-calls
+
+        An error doesn't stop the other calls; it is returned
+        in the result of the object.
+
+        :param conn: Connection-Object
+        :param arguments_list: Iterable with one dictionary of
+            *create()*-arguments per object, e.g.
+            ``{"client_id": 123, "invoice_items": [{"title": "A"}]}``
+        :param workers: Maximum count of concurrent requests
+
+        :returns: List with one Bunch (*arguments*, *item*, *error*) per
+            dictionary, in the order of *arguments_list*
+        """
+
+        def create(arguments):
+            try:
+                item = cls.create(conn = conn, **arguments)
+            except Exception as error:
+                return Bunch(arguments = arguments, item = None, error = error)
+            return Bunch(arguments = arguments, item = item, error = None)
+
+        if workers > 1:
+            return list(_iter_concurrent(create, arguments_list, workers))
+        else:
+            return map(create, arguments_list)
+
 
     def delete(self, id = None):
         """
@@ -233,14 +834,292 @@ class Item(Bunch):
         self.set_customfield(value)
 
 
+class ItemRecord(tuple):
+    """
+    ItemRecord
+
+    Base class for the lightweight records (see *Item.get_record_class*)
+    """
+
+    __slots__ = ()
+    item_class = None
+    field_positions = None
+
+
+    def to_item(self, conn):
+        """
+        Converts the record into a full Item-object,
+        e.g. to call *complete()* or *edit()*
+
+        :param conn: Connection-Object
+        """
+
+        item = self.item_class(conn = conn)
+        for field_name, value in zip(self._fields, self):
+            setattr(item, field_name, value)
+        return item
+
+
+class Items(list):
+    """
+    Items
+
+    Base class for Clients, Recurrings, ...
+
+    Set *records* to `True` to fill the list with immutable, lightweight
+    records instead of Item-objects (see *Item.get_record_class*).
+    Records can be converted into Item-objects with *record.to_item(conn)*.
+    """
+
+    item_class = Item
+    records = False
+
+    # Used if the response contains no *per_page*-attribute
+    default_per_page = 100
+
+
+    def __init__(self, conn):
+        """
+        Items-List
+
+        :param conn: Connection-Object
+        """
+
+        list.__init__(self)
+
+        self.conn = conn
+        self.url = None
+        self.per_page = None
+        self.total = None
+        self.page = None
+        self.pages = None
+
+
+    def search(self):
+        raise NotImplementedError()
+
+
+    def _create_item(self, etree_element):
+        """
+        Creates an Item-object (or a record) from one XML-element
+        of the response
+        """
+
+        if self.records:
+            return self.item_class.create_record(etree_element)
+
+        item = self.item_class(conn = self.conn)
+        item.load_from_etree(etree_element)
+        if getattr(self.conn, "identity_map", None) is not None:
+            item._add_to_identity_map()
+        return item
+
+
+    def _new_page(self):
+        """
+        Returns a new, empty list-object with the same settings
+        """
+
+        page = self.__class__.__new__(self.__class__)
+        page.__dict__.update(self.__dict__)
+        return page
+
+
+    def _check_response(self, response, url):
+        """
+        Checks the response of a page-request
+
+        Override this method to raise an error if the server
+        couldn't deliver the page.
+        """
+
+        pass
+
+
+    def _get_response(self, url):
+        """
+        Fetches one page from server
+
+        The body of the response is not loaded yet (streamed response).
+        """
+
+        response = self.conn.get(path = str(url), stream = True)
+        self._check_response(response, url)
+        return response
+
+
+    def _load_page_info(self, items_etree):
+        """
+        Takes over the page-information from the root element
+        """
+
+        self.per_page = int(items_etree.attrib.get("per_page", self.default_per_page))
+        self.total = int(items_etree.attrib.get("total", "0"))
+        self.page = int(items_etree.attrib.get("page", "1"))
+        try:
+            self.pages = (self.total // self.per_page) + int(bool(self.total % self.per_page))
+        except ZeroDivisionError:
+            self.pages = 0
+
+
+    def _parse_page(self, url, handle_element):
+        """
+        Fetches one page and calls *handle_element* for every item-element
+
+        The response is parsed incrementally while it is read from the
+        server. The page-information (total, page, per_page) is taken over
+        from the root element at once. Every item-element is handled as soon
+        as it is complete and freed afterwards.
+
+        :returns: `False` if the server sent an empty response
+        """
+
+        self.url = url
+        response = self._get_response(url)
+        reader = _ResponseReader(response)
+        start = time.time()
+        item_count = 0
+
+        try:
+            root = None
+            depth = 0
+            for event, element in iterparse(reader, events = ("start", "end")):
+                if event == "start":
+                    depth += 1
+                    if root is None:
+                        root = element
+                        self._load_page_info(root)
+                else:
+                    depth -= 1
+                    if depth == 1:
+                        handle_element(element)
+                        item_count += 1
+                        root.clear()
+        except IterParseError:
+            # No response
+            if reader.bytes_read:
+                raise
+            return False
+        except DecodeError:
+            # No response (workaround for inconsistent gziped answer)
+            if response.headers.get("content-type", "").lower() == "application/xml":
+                raise
+            return False
+        finally:
+            reader.close()
+            if getattr(self.conn, "hooks", None):
+                self.conn.report_parse(
+                    str(url),
+                    time.time() - start,
+                    item_count,
+                    bytes_received = reader.bytes_read if reader.streamed else None
+                )
+
+        return True
+
+
+    def _load_page(self, url):
+        """
+        Fetches one page and appends its items to the list
+
+        :returns: `False` if the server sent an empty response
+        """
+
+        return self._parse_page(
+            url, lambda element: self.append(self._create_item(element))
+        )
+
+
+    def _fetch_page_columns(self, url, field_names):
+        """
+        Fetches one page and returns the values of the
+        requested fields as columns (without creating Item-objects)
+        (doesn't change *self*, so it can be called from other threads)
+
+        :returns: _ColumnCollector-object
+        """
+
+        column_collector = _ColumnCollector(self.item_class, field_names)
+        self._new_page()._parse_page(url, column_collector.add)
+        return column_collector
+
+
+    def _fetch_page_items(self, url):
+        """
+        Fetches one page into a new list-object
+        (doesn't change *self*, so it can be called from other threads)
+
+        :returns: list-object or `None` if the server sent an empty response
+        """
+
+        page_items = self._new_page()
+        if not page_items._load_page(url):
+            return None
+        return page_items
+
+
+    def _load_remaining_pages(self, url, workers = 1):
+        """
+        Fetches all pages after the current page and appends their items
+        (used by *fetch_all*)
+
+        The pages are fetched in a loop. Only the items of one page
+        (resp. *workers* pages) are parsed at the same time.
+
+        :param url: Url-Object of the search (the page will be replaced)
+        :param workers: Count of concurrent requests
+        """
+
+        page_urls = [
+            _get_page_url(url, page)
+            for page in range(self.page + 1, self.pages + 1)
+        ]
+        if not page_urls:
+            return
+
+        if workers <= 1:
+            for page_url in page_urls:
+                if not self._load_page(page_url):
+                    break
+            return
+
+        for page_items in _iter_concurrent(
+            self._fetch_page_items, page_urls, workers = workers
+        ):
+            if page_items is None:
+                break
+            self.per_page = page_items.per_page
+            self.total = page_items.total
+            self.page = page_items.page
+            self.pages = page_items.pages
+            self.extend(page_items)
+
+
 class ItemsIterator(object):
     """
     ItemsIterator
 
     Base class for ClientsIterator, RecurringsIterator, ...
+
+    Set *prefetch_pages* to a value greater than 0 to load the next pages
+    in background threads, while the current page is iterated.
+    E.g. with ``prefetch_pages = 4`` the pages N+1 to N+4 are loaded
+    while page N is consumed. The items are still returned in order.
+    All threads share the connection pool of the *Connection*-object.
+
+    Loaded pages are kept in a LRU page cache with *page_cache_size* pages.
+    So access patterns, which jump between pages, don't fetch the same
+    page again and again. The cache is emptied with every new *search()*.
+    *page_cache_hits* and *page_cache_misses* count the cache usage.
+    Set *page_cache_size* to 0 to disable the page cache.
     """
 
     items = None
+    prefetch_pages = 0
+    page_cache_size = 4
+    page_cache_hits = 0
+    page_cache_misses = 0
+    _page_cache = None
 
 
     def search(self):
@@ -251,6 +1130,235 @@ class ItemsIterator(object):
         raise NotImplementedError()
 
 
+    def _fetch_page(self, page):
+        """
+        Loads one page into a new list-object and returns it
+
+        Doesn't change *self.items*, so it can be called from other threads.
+        """
+
+        iterator = copy.copy(self)
+        iterator.items = self.items._new_page()
+        iterator.load_page(page = page)
+        return iterator.items
+
+
+    def fetch_page_async(self, page):
+        """
+        Loads one page of the current search in the background
+        (needs an *AsyncConnection*)
+
+        :returns: AsyncResult; its *get()* returns the list-object
+        """
+
+        return self.conn.submit(self._fetch_page, page)
+
+
+    def iter_async(self):
+        """
+        Iterates over all found items; the next pages are requested
+        in the threads of the *AsyncConnection* and returned in order
+
+        Not more than *prefetch_pages* pages (default: count of workers
+        of the connection) are loaded ahead of the consumer. If the
+        iteration is stopped, the queued pages are skipped.
+        """
+
+        return self._iter_prefetched(
+            submit = self.conn.submit,
+            prefetch_pages = self.prefetch_pages or self.conn.workers
+        )
+
+
+    @property
+    def records(self):
+        """
+        If `True`, the iterator returns lightweight records
+        instead of Item-objects (see *Items.records*)
+        """
+
+        return self.items.records
+
+
+    @records.setter
+    def records(self, value):
+
+        self.items.records = bool(value)
+
+        # Already loaded pages contain the other type of objects
+        self._clear_page_cache()
+        self.items.page = None
+
+
+    def _get_page_cache_key(self, page):
+        """
+        Returns the key of a page in the page cache
+        """
+
+        search_params = tuple(sorted(
+            (name, repr(value)) for name, value in self.search_params.items()
+        ))
+        return search_params, self.per_page, page
+
+
+    def _clear_page_cache(self):
+        """
+        Removes all pages from the page cache
+        """
+
+        self._page_cache = collections.OrderedDict()
+
+
+    def _add_to_page_cache(self, page, items):
+        """
+        Adds one page to the page cache and removes
+        the least recently used pages if the cache is full
+        """
+
+        if self._page_cache is None:
+            self._clear_page_cache()
+        self._page_cache[self._get_page_cache_key(page)] = items
+        while len(self._page_cache) > self.page_cache_size:
+            self._page_cache.popitem(last = False)
+
+
+    def _get_page(self, page):
+        """
+        Returns the list-object with the items of the requested page
+
+        Uses the page cache if enabled, otherwise the page
+        is loaded into *self.items*.
+        """
+
+        if self.items.page == page:
+            return self.items
+
+        if self.page_cache_size <= 0:
+            self.load_page(page = page)
+            return self.items
+
+        # Page cache
+        if self._page_cache is None:
+            self._clear_page_cache()
+        key = self._get_page_cache_key(page)
+        items = self._page_cache.pop(key, None)
+        if items is None:
+            self.page_cache_misses += 1
+            items = self._fetch_page(page)
+        else:
+            self.page_cache_hits += 1
+        self._add_to_page_cache(page, items)
+
+        return items
+
+
+    def _iter_prefetched(self, submit = None, prefetch_pages = None):
+        """
+        Iterate over all found items and load the next
+        *prefetch_pages* pages in background threads
+
+        :param submit: Function ``submit(function, *args)``, which calls
+            the function in a background thread and returns an AsyncResult;
+            default: own thread pool
+        :param prefetch_pages: Size of the look-ahead window;
+            default: *self.prefetch_pages*
+        """
+
+        prefetch_pages = prefetch_pages or self.prefetch_pages
+        last_page = self.items.pages or 0
+        pool = None
+        if submit is None:
+            pool = ThreadPool(processes = prefetch_pages)
+            submit = lambda function, *args: pool.apply_async(function, args)
+        pending = {}
+
+        # Set when the iteration is stopped: queued pages are skipped
+        stopped = threading.Event()
+
+        def fetch_page(page):
+            if stopped.is_set():
+                return
+            return self._fetch_page(page)
+
+        try:
+            for page in range(1, last_page + 1):
+
+                # Fill the look-ahead window
+                last_prefetch_page = min(page + prefetch_pages, last_page)
+                for next_page in range(page + 1, last_prefetch_page + 1):
+                    if next_page in pending or next_page == self.items.page:
+                        continue
+                    if (
+                        self._page_cache and
+                        self._get_page_cache_key(next_page) in self._page_cache
+                    ):
+                        continue
+                    pending[next_page] = submit(fetch_page, next_page)
+
+                # Get page
+                if page in pending:
+                    items = pending.pop(page).get()
+                    if self.page_cache_size > 0:
+                        self.page_cache_misses += 1
+                        self._add_to_page_cache(page, items)
+                else:
+                    items = self._get_page(page)
+
+                for item in items:
+                    yield item
+        finally:
+            stopped.set()
+            if pool is not None:
+                pool.terminate()
+
+
+    def to_columns(self, field_names = None, numpy_arrays = True):
+        """
+        Loads all found items directly into columns
+
+        The values are taken straight from the XML-responses.
+        No Item-objects are created.
+        The pages are fetched with *prefetch_pages* concurrent requests.
+
+        :param field_names: List with the names of the fields to load.
+            Default: All fields of the record class (see *Item.get_record_class*)
+        :param numpy_arrays: If `True` and NumPy is installed, the columns
+            are returned as typed NumPy-arrays: int64 ids, datetime64 dates,
+            float64 amounts (NaN/NaT for missing values).
+            Otherwise lists are returned.
+
+        :returns: Dictionary with the field names as keys and the columns
+            as values
+        """
+
+        item_class = self.items.item_class
+        if field_names is None:
+            field_names = item_class.get_record_class()._fields
+        column_collector = _ColumnCollector(item_class, field_names)
+
+        if self.items.pages:
+            page_urls = [
+                _get_page_url(self.items.url, page)
+                for page in range(1, self.items.pages + 1)
+            ]
+            fetch_page_columns = functools.partial(
+                self.items._fetch_page_columns, field_names = field_names
+            )
+            if self.prefetch_pages > 0:
+                page_column_collectors = _iter_concurrent(
+                    fetch_page_columns, page_urls, workers = self.prefetch_pages
+                )
+            else:
+                page_column_collectors = itertools.imap(fetch_page_columns, page_urls)
+            for page_column_collector in page_column_collectors:
+                column_collector.extend(page_column_collector)
+
+        if numpy_arrays and _import_numpy() is not None:
+            return column_collector.get_arrays()
+        else:
+            return column_collector.columns
+
+
     def __len__(self):
         """
         Returns the count of found recurrings
@@ -267,10 +1375,13 @@ class ItemsIterator(object):
         if not self.items.pages:
             return
 
+        if self.prefetch_pages > 0:
+            for item in self._iter_prefetched():
+                yield item
+            return
+
         for page in range(1, self.items.pages + 1):
-            if not self.items.page == page:
-                self.load_page(page = page)
-            for item in self.items:
+            for item in self._get_page(page):
                 yield item
 
 
@@ -280,33 +1391,35 @@ class ItemsIterator(object):
         """
 
         # List-Ids
-        all_list_ids = range(len(self))
-        requested_list_ids = all_list_ids[key]
-        is_list = isinstance(requested_list_ids, list)
-        if not is_list:
-            requested_list_ids = [requested_list_ids]
-        assert isinstance(requested_list_ids, list)
-
-        result = []
-
-        for list_id in requested_list_ids:
-
-            # In welcher Seite befindet sich die gewünschte ID?
-            for page_nr in range(1, self.items.pages + 1):
-                max_list_id = (page_nr * self.items.per_page) - 1
-                if list_id <= max_list_id:
-                    page = page_nr
-                    break
-            else:
-                raise AssertionError()
+        if isinstance(key, slice):
+            requested_list_ids = xrange(*key.indices(len(self)))
+            is_list = True
+        else:
+            requested_list_ids = [xrange(len(self))[key]]
+            is_list = False
+
+        # Group the requested list-ids by page (every page is loaded only once)
+        per_page = self.items.per_page
+        page_positions = collections.OrderedDict()
+        for position, list_id in enumerate(requested_list_ids):
+            page, list_id_in_page = divmod(list_id, per_page)
+            page_positions.setdefault(page + 1, []).append(
+                (position, list_id_in_page)
+            )
+
+        # The currently loaded page first
+        pages = sorted(page_positions, key = lambda page: page != self.items.page)
+
+        result = [None] * len(requested_list_ids)
+
+        for page in pages:
 
             # Load page if neccessary
-            if not self.items.page == page:
-                self.load_page(page = page)
+            items = self._get_page(page)
 
-            # Add equested invoice-object to result
-            list_id_in_page = list_id - ((page - 1) * self.items.per_page)
-            result.append(self.items[list_id_in_page])
+            # Add requested item-objects to result
+            for position, list_id_in_page in page_positions[page]:
+                result[position] = items[list_id_in_page]
 
         if is_list:
             return result
@@ -12,7 +12,7 @@ import xml.etree.ElementTree as ET
 from munch import Munch as Bunch
 from http import Url
 import errors
-from _items_base import Item, ItemsIterator
+from _items_base import Item, Items, ItemsIterator
 
 
 def _article_xml(
@@ -314,7 +314,10 @@ class Article(Item):
     #     ...
 
 
-class Articles(list):
+class Articles(Items):
+
+    item_class = Article
+
 
     def __init__(self, conn):
         """
@@ -323,13 +326,7 @@ class Articles(list):
         :param conn: Connection-Object
         """
 
-        list.__init__(self)
-
-        self.conn = conn
-        self.per_page = None
-        self.total = None
-        self.page = None
-        self.pages = None
+        Items.__init__(self, conn = conn)
 
 
     def search(
@@ -345,6 +342,7 @@ class Articles(list):
 
         order_by = None,
         fetch_all = False,
+        fetch_all_workers = 1,
         allow_empty_filter = False,
         keep_old_items = False,
         page = 1,
@@ -371,6 +369,9 @@ class Articles(list):
 
         :param allow_empty_filter: If `True`, every filter-parameter may be empty.
             So, all articles will returned. !!! EVERY INVOICE !!!
+        :param fetch_all_workers: Count of concurrent requests if *fetch_all*
+            is `True`. After the first page, all remaining pages are fetched
+            in parallel. The order of the items is preserved.
         """
         
         # Check empty filter
@@ -419,42 +420,11 @@ class Articles(list):
             url.query["supplier_id"] = supplier_id
 
         # Fetch data
-        response = self.conn.get(path = str(url))
-
-        # Parse XML
-        articles_etree = ET.fromstring(response.data)
-
-        self.per_page = int(articles_etree.attrib.get("per_page", "100"))
-        self.total = int(articles_etree.attrib.get("total", "0"))
-        self.page = int(articles_etree.attrib.get("page", "1"))
-        try:
-            self.pages = (self.total // self.per_page) + int(bool(self.total % self.per_page))
-        except ZeroDivisionError:
-            self.pages = 0
-
-        # Iterate over all articles
-        for article_etree in articles_etree:
-            self.append(Article(conn = self.conn, article_etree = article_etree))
+        self._load_page(url)
 
         # Fetch all
-        if fetch_all and self.total > (self.page * self.per_page):
-            self.search(
-                # Search parameters
-                article_number = article_number,
-                title = title,
-                description = description,
-                currency_code = currency_code,
-                unit_id = unit_id,
-                tags = tags,
-                supplier_id = supplier_id,
-
-                order_by = order_by,
-                fetch_all = fetch_all,
-                allow_empty_filter = allow_empty_filter,
-                keep_old_items = True,
-                page = page + 1,
-                per_page = per_page
-            )
+        if fetch_all:
+            self._load_remaining_pages(url = url, workers = fetch_all_workers)
 
 
 class ArticlesIterator(ItemsIterator):
@@ -508,6 +478,7 @@ class ArticlesIterator(ItemsIterator):
         self.search_params.order_by = order_by
 
         # Search and prepare first page as result
+        self._clear_page_cache()
         self.load_page(1)
 
 
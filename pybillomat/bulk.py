@@ -0,0 +1,186 @@
+#!/usr/bin/env python
+# coding: utf-8
+"""
+Bulk operations
+
+Completes and sends many invoices or reminders with concurrent requests.
+"""
+
+import itertools
+import json
+import os
+import threading
+from munch import Munch as Bunch
+from _items_base import _iter_concurrent
+
+
+class BulkDocumentJob(object):
+    """
+    Runs *complete()* and then *send()* for many documents
+    (Invoice- or Reminder-objects)
+
+    The requests go through the connection of the documents, so they
+    share its rate limiter and retry policy.
+
+    With a checkpoint file every finished step is written to the file.
+    If the job is started again with the same checkpoint file (e.g. after
+    a crash), finished steps are skipped.
+    """
+
+    def __init__(
+        self,
+        complete = True,
+        send = True,
+        template_id = None,
+        send_arguments = None,
+        workers = 4,
+        checkpoint_filename = None
+    ):
+        """
+        :param complete: If `True`, *complete()* is called for every
+            document in the draft status or with unknown status
+            (not loaded)
+        :param send: If `True`, *send()* is called for every document
+        :param template_id: *template_id* for *complete()*
+        :param send_arguments: Dictionary with arguments for *send()*,
+            e.g. ``{"subject": "Invoice", "body": "..."}``
+        :param workers: Maximum count of documents processed at the
+            same time
+        :param checkpoint_filename: File with the finished steps (JSON lines);
+            `None` = no checkpoint
+        """
+
+        self.complete = complete
+        self.send = send
+        self.template_id = template_id
+        self.send_arguments = send_arguments or {}
+        self.workers = workers
+        self.checkpoint_filename = checkpoint_filename
+
+        self._finished_steps = set()
+        self._checkpoint_file = None
+        self._checkpoint_lock = threading.Lock()
+
+
+    def _load_checkpoint(self):
+        """
+        Reads the finished steps from the checkpoint file
+        """
+
+        self._finished_steps = set()
+        if not self.checkpoint_filename:
+            return
+        if not os.path.exists(self.checkpoint_filename):
+            return
+
+        with open(self.checkpoint_filename, "rb") as checkpoint_file:
+            for line in checkpoint_file:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    # Incomplete line (crash while writing)
+                    continue
+                if not entry.get("error"):
+                    self._finished_steps.add(
+                        (entry["base_path"], entry["id"], entry["step"])
+                    )
+
+
+    def _write_checkpoint(self, document, step, error = None):
+        """
+        Appends one finished (or failed) step to the checkpoint file
+        """
+
+        if self._checkpoint_file is None:
+            return
+
+        line = json.dumps({
+            "base_path": document.base_path,
+            "id": document.id,
+            "step": step,
+            "error": unicode(error) if error else None,
+        })
+        with self._checkpoint_lock:
+            self._checkpoint_file.write(line + "\n")
+            self._checkpoint_file.flush()
+
+
+    def _is_finished(self, document, step):
+        return (document.base_path, document.id, step) in self._finished_steps
+
+
+    def _process(self, document):
+        """
+        Completes and sends one document
+
+        :returns: Bunch with the result of the document
+        """
+
+        result = Bunch(
+            base_path = document.base_path,
+            id = document.id,
+            completed = False,
+            sent = False,
+            error = None,
+        )
+
+        try:
+            # Complete
+            if self.complete:
+                if self._is_finished(document, "complete"):
+                    result.completed = True
+                elif document.get("status") not in (None, "DRAFT"):
+                    # Already completed (e.g. before a crash)
+                    result.completed = True
+                else:
+                    document.complete(template_id = self.template_id)
+                    result.completed = True
+                    self._write_checkpoint(document, "complete")
+
+            # Send
+            if self.send:
+                if self._is_finished(document, "send"):
+                    result.sent = True
+                else:
+                    document.send(**self.send_arguments)
+                    result.sent = True
+                    self._write_checkpoint(document, "send")
+
+        except Exception as error:
+            result.error = error
+            if self.complete and not result.completed:
+                self._write_checkpoint(document, "complete", error = error)
+            else:
+                self._write_checkpoint(document, "send", error = error)
+
+        return result
+
+
+    def run(self, documents):
+        """
+        Processes all documents
+
+        :param documents: Iterable with documents. Completed documents
+            drop out of a search for DRAFT-documents, so such a search
+            result should be loaded first, e.g. ``list(invoices_iterator)``.
+
+        :returns: List with one Bunch (*base_path*, *id*, *completed*,
+            *sent*, *error*) per document, in the order of the documents
+        """
+
+        self._load_checkpoint()
+        if self.checkpoint_filename:
+            self._checkpoint_file = open(self.checkpoint_filename, "ab")
+
+        try:
+            if self.workers > 1:
+                results = _iter_concurrent(
+                    self._process, documents, self.workers
+                )
+            else:
+                results = itertools.imap(self._process, documents)
+            return list(results)
+        finally:
+            if self._checkpoint_file is not None:
+                self._checkpoint_file.close()
+                self._checkpoint_file = None
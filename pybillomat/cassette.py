@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+# coding: utf-8
+"""
+Cassette: Record and replay HTTP-requests
+
+In the mode "record" the *Connection* sends every request to the server
+and writes the request and the response into the cassette file.
+In the mode "replay" the responses are taken from the cassette file;
+there is no network I/O at all.
+
+The cassette file is a gzip-compressed file with one JSON-line per
+request. Bodies are base64-encoded.
+"""
+
+import base64
+import collections
+import gzip
+import json
+import struct
+import threading
+import time
+import errors
+from response_cache import CachedResponse
+
+
+RECORD = "record"
+REPLAY = "replay"
+
+# Headers which don't describe the (decoded) body
+_SKIPPED_HEADERS = frozenset([
+    "connection",
+    "content-encoding",
+    "content-length",
+    "keep-alive",
+    "transfer-encoding",
+])
+
+
+def _encode_bytes(data):
+    if data is None:
+        return None
+    if isinstance(data, unicode):
+        data = data.encode("utf-8")
+    return base64.b64encode(data)
+
+
+def _decode_bytes(data):
+    if data is None:
+        return None
+    return base64.b64decode(data)
+
+
+class Cassette(object):
+    """
+    Thread-safe record/replay store for *Connection*
+    """
+
+    def __init__(self, filename, mode = REPLAY, time_scale = None):
+        """
+        :param filename: Path of the cassette file
+        :param mode: "record" (overwrites the file) or "replay"
+        :param time_scale: Replay only: Every response is delayed by
+            the recorded duration multiplied with *time_scale*
+            (e.g. 2.0 = two times slower server);
+            `None` = responses without delay
+        """
+
+        if mode not in (RECORD, REPLAY):
+            raise ValueError("Unknown cassette mode: {0!r}".format(mode))
+
+        self.filename = filename
+        self.mode = mode
+        self.time_scale = time_scale
+        self.recorded_count = 0
+        self.replayed_count = 0
+        self._lock = threading.Lock()
+        self._file = None
+        self._interactions = {}
+
+        if mode == RECORD:
+            self._file = gzip.open(filename, "wb")
+        else:
+            self._load()
+
+
+    def _load(self):
+        """
+        Reads all interactions of the cassette file
+        """
+
+        interactions = collections.defaultdict(collections.deque)
+        with gzip.open(self.filename, "rb") as cassette_file:
+            try:
+                for line in cassette_file:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        # Incomplete line (crash while recording)
+                        continue
+                    key = (entry["method"], entry["path"], entry["body"])
+                    interactions[key].append(entry)
+            except (IOError, EOFError, struct.error):
+                # Cassette file wasn't closed after recording
+                pass
+        self._interactions = dict(interactions)
+
+
+    def record(self, method, path, body, status, headers, data, seconds):
+        """
+        Writes one request and its response into the cassette file
+
+        :param seconds: Duration of the request
+
+        :returns: *CachedResponse* with the recorded data
+        """
+
+        headers = dict(
+            (name.lower(), value)
+            for name, value in headers.items()
+            if name.lower() not in _SKIPPED_HEADERS
+        )
+        line = json.dumps({
+            "method": method,
+            "path": path,
+            "body": _encode_bytes(body),
+            "status": status,
+            "headers": headers,
+            "data": _encode_bytes(data),
+            "seconds": round(seconds, 6),
+        })
+        with self._lock:
+            self._file.write(line + "\n")
+            self.recorded_count += 1
+
+        return CachedResponse(data = data, headers = headers, status = status)
+
+
+    def replay(self, method, path, body):
+        """
+        Returns the recorded response of a request
+
+        Identical requests get the responses in the recorded order;
+        if there are more requests than recorded responses,
+        the last response is repeated.
+
+        :returns: *CachedResponse*
+        """
+
+        key = (method, path, _encode_bytes(body))
+        with self._lock:
+            entries = self._interactions.get(key)
+            if not entries:
+                raise errors.CassetteError(
+                    "No recorded response for {0} {1}".format(method, path)
+                )
+            if len(entries) > 1:
+                entry = entries.popleft()
+            else:
+                entry = entries[0]
+            self.replayed_count += 1
+
+        if self.time_scale:
+            time.sleep(entry["seconds"] * self.time_scale)
+
+        return CachedResponse(
+            data = _decode_bytes(entry["data"]),
+            headers = entry["headers"],
+            status = entry["status"]
+        )
+
+
+    def close(self):
+        """
+        Finishes the cassette file (mode "record")
+        """
+
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
@@ -0,0 +1,256 @@
+#!/usr/bin/env python
+# coding: utf-8
+"""
+Client index
+
+Loads all clients with one *ClientsIterator*-pass and finds them by
+client number, email or name without requests to the server.
+"""
+
+import re
+import threading
+import unicodedata
+from clients import ClientsIterator
+
+
+_WHITESPACE_PATTERN = re.compile(r"\s+", re.UNICODE)
+
+
+def normalize_name(name):
+    """
+    Returns the name for the index: Unicode-normalized (NFKC),
+    lower case, without surplus whitespace
+    """
+
+    if not name:
+        return u""
+    if isinstance(name, str):
+        name = name.decode("utf-8")
+    name = unicodedata.normalize("NFKC", name).lower()
+    return _WHITESPACE_PATTERN.sub(u" ", name).strip()
+
+
+def normalize_email(email):
+    """
+    Returns the email address for the index: lower case, stripped
+    """
+
+    if not email:
+        return u""
+    if isinstance(email, str):
+        email = email.decode("utf-8")
+    return email.strip().lower()
+
+
+class ClientIndex(object):
+    """
+    In-memory index of all clients (Client-objects)
+
+    Hash indexes on *client_number*, *email* (case-insensitive) and the
+    normalized *name* (company name or first and last name).
+    *refresh()* loads only the clients which were created since the last
+    build or refresh (descending id order, stops at the highest known id).
+    Changed or deleted clients are only taken over by
+    ``refresh(full = True)`` or by *add()*/*remove()*.
+    """
+
+    def __init__(self, conn, per_page = 250):
+        """
+        :param conn: Connection-Object
+        :param per_page: Page size of the *ClientsIterator*
+        """
+
+        self.conn = conn
+        self.per_page = per_page
+        self.max_id = 0
+
+        self._clients = {}
+        self._keys = {}
+        self._by_client_number = {}
+        self._by_email = {}
+        self._by_name = {}
+        self._lock = threading.Lock()
+
+
+    def _get_keys(self, client):
+        """
+        Returns the index keys of a client:
+        (client_number, email, normalized name)
+        """
+
+        name = client.get("name")
+        if not name:
+            name = u" ".join(
+                part for part in (client.get("first_name"), client.get("last_name"))
+                if part
+            )
+        return (
+            client.get("client_number") or None,
+            normalize_email(client.get("email")) or None,
+            normalize_name(name) or None,
+        )
+
+
+    def _add(self, client):
+        self._remove(client.id)
+        self._clients[client.id] = client
+        self.max_id = max(self.max_id, client.id)
+
+        keys = self._keys[client.id] = self._get_keys(client)
+        client_number, email, name = keys
+        if client_number:
+            self._by_client_number[client_number] = client.id
+        if email:
+            self._by_email.setdefault(email, []).append(client.id)
+        if name:
+            self._by_name.setdefault(name, []).append(client.id)
+
+
+    def _remove(self, client_id):
+        # Keys at the time of adding (the object may have been changed)
+        keys = self._keys.pop(client_id, None)
+        if keys is None:
+            return
+        del self._clients[client_id]
+
+        client_number, email, name = keys
+        if self._by_client_number.get(client_number) == client_id:
+            del self._by_client_number[client_number]
+        for index, key in ((self._by_email, email), (self._by_name, name)):
+            ids = index.get(key)
+            if ids and client_id in ids:
+                ids.remove(client_id)
+                if not ids:
+                    del index[key]
+
+
+    def _search(self, order_by):
+        iterator = ClientsIterator(self.conn, per_page = self.per_page)
+        iterator.search(order_by = order_by)
+        return iterator
+
+
+    def build(self):
+        """
+        Loads all clients and builds the indexes
+
+        :returns: Count of clients
+        """
+
+        clients = list(self._search(order_by = "id"))
+        with self._lock:
+            self._clients = {}
+            self._keys = {}
+            self._by_client_number = {}
+            self._by_email = {}
+            self._by_name = {}
+            self.max_id = 0
+            for client in clients:
+                self._add(client)
+            return len(self._clients)
+
+
+    def refresh(self, full = False):
+        """
+        Loads the new clients (all clients, if the index is empty)
+
+        :param full: If `True`, the index is built again
+
+        :returns: Count of loaded clients
+        """
+
+        if full or not self._clients:
+            return self.build()
+
+        clients = []
+        for client in self._search(order_by = "id DESC"):
+            if client.id <= self.max_id:
+                break
+            clients.append(client)
+
+        with self._lock:
+            for client in clients:
+                self._add(client)
+        return len(clients)
+
+
+    def add(self, client):
+        """
+        Adds a new or changed client (e.g. after *Client.create()*
+        or *Client.edit()*)
+        """
+
+        with self._lock:
+            self._add(client)
+
+
+    def remove(self, client_id):
+        """
+        Removes a client from the index (e.g. after *Client.delete()*)
+        """
+
+        with self._lock:
+            self._remove(client_id)
+
+
+    def _get_clients(self, client_ids):
+        clients = (self._clients.get(client_id) for client_id in list(client_ids))
+        return [client for client in clients if client is not None]
+
+
+    def get(self, client_id):
+        """
+        Returns the client with the id or `None`
+        """
+
+        return self._clients.get(client_id)
+
+
+    def get_by_client_number(self, client_number):
+        """
+        Returns the client with the client number or `None`
+        """
+
+        client_id = self._by_client_number.get(client_number)
+        if client_id is not None:
+            return self._clients.get(client_id)
+
+
+    def find_by_email(self, email):
+        """
+        Returns a list with the clients with the email address
+        (case-insensitive)
+        """
+
+        ids = self._by_email.get(normalize_email(email), ())
+        return self._get_clients(ids)
+
+
+    def get_by_email(self, email):
+        """
+        Returns the client with the email address (case-insensitive);
+        the client with the lowest id, if more clients have this address;
+        `None` if not found
+        """
+
+        clients = self.find_by_email(email)
+        if clients:
+            return min(clients, key = lambda client: client.id)
+
+
+    def find_by_name(self, name):
+        """
+        Returns a list with the clients with the name
+        (compared with *normalize_name*)
+        """
+
+        ids = self._by_name.get(normalize_name(name), ())
+        return self._get_clients(ids)
+
+
+    def __len__(self):
+        return len(self._clients)
+
+
+    def __contains__(self, client_id):
+        return client_id in self._clients
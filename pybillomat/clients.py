@@ -12,7 +12,7 @@ import xml.etree.ElementTree as ET
 import errors
 from munch import Munch as Bunch
 from http import Url
-from _items_base import Item, ItemsIterator
+from _items_base import Item, Items, ItemsIterator
 
 
 def _client_xml(
@@ -743,7 +743,11 @@ class Client(Item):
             raise errors.BillomatError(unicode(response.data, encoding = "utf-8"))
 
 
-class Clients(list):
+class Clients(Items):
+
+    item_class = Client
+    default_per_page = 0
+
 
     def __init__(self, conn):
         """
@@ -752,13 +756,7 @@ class Clients(list):
         :param conn: Connection-Object
         """
 
-        list.__init__(self)
-
-        self.conn = conn
-        self.per_page = None
-        self.total = None
-        self.page = None
-        self.pages = None
+        Items.__init__(self, conn = conn)
 
 
     def search(
@@ -776,6 +774,7 @@ class Clients(list):
         order_by = None,
 
         fetch_all = False,
+        fetch_all_workers = 1,
         allow_empty_filter = False,
         keep_old_items = False,
         page = 1,
@@ -804,6 +803,9 @@ class Clients(list):
 
         :param allow_empty_filter: If `True`, every filter-parameter may be empty.
             All clients will returned. !!! EVERY CLIENT !!!
+        :param fetch_all_workers: Count of concurrent requests if *fetch_all*
+            is `True`. After the first page, all remaining pages are fetched
+            in parallel. The order of the items is preserved.
         """
         
         # Check empty filter
@@ -858,44 +860,11 @@ class Clients(list):
             url.query["tags"] = tags
 
         # Fetch data
-        response = self.conn.get(path = str(url))
-
-        # Parse XML
-        clients_etree = ET.fromstring(response.data)
-
-        self.per_page = int(clients_etree.attrib.get("per_page", "0"))
-        self.total = int(clients_etree.attrib.get("total", "0"))
-        self.page = int(clients_etree.attrib.get("page", "1"))
-        try:
-            self.pages = (self.total // self.per_page) + int(bool(self.total % self.per_page))
-        except ZeroDivisionError:
-            self.pages = 0
-
-        # Iterate over all clients
-        for client_etree in clients_etree:
-            self.append(Client(conn = self.conn, client_etree = client_etree))
+        self._load_page(url)
 
         # Fetch all
-        if fetch_all and self.total > (self.page * self.per_page):
-            self.search(
-                # Search parameters
-                name = name,
-                client_number = client_number,
-                email = email,
-                first_name = first_name,
-                last_name = last_name,
-                country_code = country_code,
-                note = note,
-                invoice_id = invoice_id,
-                tags = tags,
-                order_by = order_by,
-
-                fetch_all = fetch_all,
-                allow_empty_filter = allow_empty_filter,
-                keep_old_items = True,
-                page = page + 1,
-                per_page = per_page
-            )
+        if fetch_all:
+            self._load_remaining_pages(url = url, workers = fetch_all_workers)
 
 
 class ClientsIterator(ItemsIterator):
@@ -955,6 +924,7 @@ class ClientsIterator(ItemsIterator):
         self.search_params.order_by = order_by
 
         # Search and prepare first page as result
+        self._clear_page_cache()
         self.load_page(1)
 
 
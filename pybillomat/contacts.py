@@ -12,7 +12,7 @@ import errors
 import xml.etree.ElementTree as ET
 from munch import Munch as Bunch
 from http import Url
-from _items_base import Item, ItemsIterator
+from _items_base import Item, Items, ItemsIterator
 
 
 def _contact_xml(
@@ -284,7 +284,10 @@ class Contact(Item):
             raise errors.BillomatError(unicode(response.data, encoding = "utf-8"))
 
 
-class Contacts(list):
+class Contacts(Items):
+
+    item_class = Contact
+
 
     def __init__(self, conn):
         """
@@ -293,13 +296,7 @@ class Contacts(list):
         :param conn: Connection-Object
         """
 
-        list.__init__(self)
-
-        self.conn = conn
-        self.per_page = None
-        self.total = None
-        self.page = None
-        self.pages = None
+        Items.__init__(self, conn = conn)
 
 
     def search(
@@ -309,6 +306,7 @@ class Contacts(list):
 
         order_by = None,
         fetch_all = False,
+        fetch_all_workers = 1,
         keep_old_items = False,
         page = 1,
         per_page = None
@@ -324,6 +322,9 @@ class Contacts(list):
             Nested sort orders are possible. Please separate the sort orders by
             comma.
 
+        :param fetch_all_workers: Count of concurrent requests if *fetch_all*
+            is `True`. After the first page, all remaining pages are fetched
+            in parallel. The order of the items is preserved.
         """
 
         # Check empty param
@@ -350,37 +351,11 @@ class Contacts(list):
         url.query["client_id"] = client_id
 
         # Fetch data
-        response = self.conn.get(path = str(url))
-
-        # Parse XML
-        contacts_etree = ET.fromstring(response.data)
-
-        self.per_page = int(contacts_etree.attrib.get("per_page", "100"))
-        self.total = int(contacts_etree.attrib.get("total", "0"))
-        self.page = int(contacts_etree.attrib.get("page", "1"))
-        try:
-            self.pages = (self.total // self.per_page) + int(bool(self.total % self.per_page))
-        except ZeroDivisionError:
-            self.pages = 0
-
-        # Iterate over all contacts
-        for contact_etree in contacts_etree:
-            self.append(
-                Contact(conn = self.conn, contact_etree = contact_etree)
-            )
+        self._load_page(url)
 
         # Fetch all
-        if fetch_all and self.total > (self.page * self.per_page):
-            self.search(
-                # Search parameters
-                client_id = client_id,
-
-                order_by = order_by,
-                fetch_all = fetch_all,
-                keep_old_items = True,
-                page = page + 1,
-                per_page = per_page
-            )
+        if fetch_all:
+            self._load_remaining_pages(url = url, workers = fetch_all_workers)
 
 
 class ContactsIterator(ItemsIterator):
@@ -417,6 +392,7 @@ class ContactsIterator(ItemsIterator):
         self.search_params.order_by = order_by
 
         # Search and prepare first page as result
+        self._clear_page_cache()
         self.load_page(1)
 
 
@@ -12,7 +12,7 @@ import errors
 import xml.etree.ElementTree as ET
 from munch import Munch as Bunch
 from http import Url
-from _items_base import Item, ItemsIterator
+from _items_base import Item, Items, ItemsIterator
 
 
 def _credit_note_item_xml(
@@ -25,10 +25,13 @@ def _credit_note_item_xml(
     tax_rate = None,  # float
     title = None,
     description = None,
-    reduction = None
+    reduction = None,
+    as_etree = False
 ):
     """
     Creates the XML to add or edit an credit note item
+
+    :param as_etree: If `True`, the XML-element is returned
     """
 
     integer_field_names = [
@@ -74,12 +77,39 @@ def _credit_note_item_xml(
             new_tag.text = unicode(value)
             credit_note_item_tag.append(new_tag)
 
+    if as_etree:
+        return credit_note_item_tag
+
     xml = ET.tostring(credit_note_item_tag)
 
     # Finished
     return xml
 
 
+def _credit_note_items_etree(credit_note_items):
+    """
+    Creates the <credit-note-items>-element with the items of a new credit note
+
+    :param credit_note_items: List with CreditNoteItem-Objects or dictionaries
+    """
+
+    credit_note_items_tag = ET.Element("credit-note-items")
+    for credit_note_item in credit_note_items:
+        credit_note_items_tag.append(_credit_note_item_xml(
+            article_id = credit_note_item.get("article_id"),
+            unit = credit_note_item.get("unit"),
+            quantity = credit_note_item.get("quantity"),
+            unit_price = credit_note_item.get("unit_price"),
+            tax_name = credit_note_item.get("tax_name"),
+            tax_rate = credit_note_item.get("tax_rate"),
+            title = credit_note_item.get("title"),
+            description = credit_note_item.get("description"),
+            reduction = credit_note_item.get("reduction"),
+            as_etree = True
+        ))
+    return credit_note_items_tag
+
+
 class CreditNoteItem(Item):
 
     base_path = u"/api/credit-note-items"
@@ -241,7 +271,10 @@ class CreditNoteItem(Item):
             raise errors.BillomatError(unicode(response.data, encoding = "utf-8"))
 
 
-class CreditNoteItems(list):
+class CreditNoteItems(Items):
+
+    item_class = CreditNoteItem
+
 
     def __init__(self, conn):
         """
@@ -250,13 +283,7 @@ class CreditNoteItems(list):
         :param conn: Connection-Object
         """
 
-        list.__init__(self)
-
-        self.conn = conn
-        self.per_page = None
-        self.total = None
-        self.page = None
-        self.pages = None
+        Items.__init__(self, conn = conn)
 
 
     def search(
@@ -266,6 +293,7 @@ class CreditNoteItems(list):
 
         order_by = None,
         fetch_all = False,
+        fetch_all_workers = 1,
         keep_old_items = False,
         page = 1,
         per_page = None,
@@ -286,6 +314,9 @@ class CreditNoteItems(list):
             If no order is specified, ascending order (ASC) is used.
             Nested sort orders are possible. Please separate the sort orders by
             comma.
+        :param fetch_all_workers: Count of concurrent requests if *fetch_all*
+            is `True`. After the first page, all remaining pages are fetched
+            in parallel. The order of the items is preserved.
         """
 
         # Check empty param
@@ -315,37 +346,11 @@ class CreditNoteItems(list):
         url.query["credit_note_id"] = credit_note_id
 
         # Fetch data
-        response = self.conn.get(path = str(url))
-
-        # Parse XML
-        credit_note_items_etree = ET.fromstring(response.data)
-
-        self.per_page = int(credit_note_items_etree.attrib.get("per_page", "100"))
-        self.total = int(credit_note_items_etree.attrib.get("total", "0"))
-        self.page = int(credit_note_items_etree.attrib.get("page", "1"))
-        try:
-            self.pages = (self.total // self.per_page) + int(bool(self.total % self.per_page))
-        except ZeroDivisionError:
-            self.pages = 0
-
-        # Iterate over all items
-        for credit_note_item_etree in credit_note_items_etree:
-            self.append(
-                CreditNoteItem(conn = self.conn, credit_note_item_etree = credit_note_item_etree)
-            )
+        self._load_page(url)
 
         # Fetch all
-        if fetch_all and self.total > (self.page * self.per_page):
-            self.search(
-                # Search parameters
-                credit_note_id = credit_note_id,
-
-                order_by = order_by,
-                fetch_all = fetch_all,
-                keep_old_items = True,
-                page = page + 1,
-                per_page = per_page
-            )
+        if fetch_all:
+            self._load_remaining_pages(url = url, workers = fetch_all_workers)
 
 
 class CreditNoteItemsIterator(ItemsIterator):
@@ -387,6 +392,7 @@ class CreditNoteItemsIterator(ItemsIterator):
         self.search_params.order_by = order_by
 
         # Search and prepare first page as result
+        self._clear_page_cache()
         self.load_page(1)
 
 
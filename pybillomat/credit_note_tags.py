@@ -7,12 +7,11 @@ CreditNote-Tags
 - Deutsche API-Beschreibung: http://www.billomat.com/api/gutschriften/schlagworte/
 """
 
-import urllib3
 import xml.etree.ElementTree as ET
 import errors
 from munch import Munch as Bunch
 from http import Url
-from _items_base import Item, ItemsIterator
+from _items_base import Item, Items, ItemsIterator
 
 
 class CreditNoteTag(Item):
@@ -83,7 +82,11 @@ class CreditNoteTag(Item):
         return item_object
 
 
-class CreditNoteTags(list):
+class CreditNoteTags(Items):
+
+    item_class = CreditNoteTag
+    default_per_page = 0
+
 
     def __init__(self, conn):
         """
@@ -92,13 +95,27 @@ class CreditNoteTags(list):
         :param conn: Connection-Object
         """
 
-        list.__init__(self)
+        Items.__init__(self, conn = conn)
 
-        self.conn = conn
-        self.per_page = None
-        self.total = None
-        self.page = None
-        self.pages = None
+
+    def _check_response(self, response, url):
+        """
+        Raises an error if the server couldn't deliver the page
+        """
+
+        if response.status != 200:
+            # Check if "Unothorized" --> raise NotFoundError
+            errors_etree = ET.fromstring(response.data)
+            for error_etree in errors_etree:
+                text = error_etree.text
+                if text.lower() == "unauthorized":
+                    raise errors.NotFoundError(
+                        u"credit_note_id: {credit_note_id}".format(
+                            credit_note_id = url.query.get("credit_note_id")
+                        )
+                    )
+            # Other Error
+            raise errors.BillomatError(response.data)
 
 
     def search(
@@ -108,6 +125,7 @@ class CreditNoteTags(list):
         order_by = None,
 
         fetch_all = False,
+        fetch_all_workers = 1,
         allow_empty_filter = False,
         keep_old_items = False,
         page = 1,
@@ -127,6 +145,9 @@ class CreditNoteTags(list):
 
         :param allow_empty_filter: If `True`, every filter-parameter may be empty.
             All credit note tags will returned. !!! EVERY !!!
+        :param fetch_all_workers: Count of concurrent requests if *fetch_all*
+            is `True`. After the first page, all remaining pages are fetched
+            in parallel. The order of the items is preserved.
         """
 
         # Check empty filter
@@ -157,59 +178,12 @@ class CreditNoteTags(list):
             url.query["credit_note_id"] = credit_note_id
 
         # Fetch data
-        response = self.conn.get(path = str(url))
-        if response.status != 200:
-            # Check if "Unothorized" --> raise NotFoundError
-            errors_etree = ET.fromstring(response.data)
-            for error_etree in errors_etree:
-                text = error_etree.text
-                if text.lower() == "unauthorized":
-                    raise errors.NotFoundError(
-                        u"credit_note_id: {credit_note_id}".format(credit_note_id = credit_note_id)
-                    )
-            # Other Error
-            raise errors.BillomatError(response.data)
-
-        # No response (workaround for inconsistent gziped answer; DecodeError)
-        try:
-            if len(response.data) == 0:
-                return
-        except urllib3.exceptions.DecodeError:
-            if response.headers.get("content-type", "").lower() != "application/xml":
-                return
-            else:
-                raise
-
-        # Parse XML
-        tags_etree = ET.fromstring(response.data)
-
-        self.per_page = int(tags_etree.attrib.get("per_page", "0"))
-        self.total = int(tags_etree.attrib.get("total", "0"))
-        self.page = int(tags_etree.attrib.get("page", "1"))
-        try:
-            self.pages = (self.total // self.per_page) + int(bool(self.total % self.per_page))
-        except ZeroDivisionError:
-            self.pages = 0
-
-        # Iterate over all tags
-        for tag_etree in tags_etree:
-            self.append(
-                CreditNoteTag(conn = self.conn, tag_etree = tag_etree)
-            )
+        if not self._load_page(url):
+            return
 
         # Fetch all
-        if fetch_all and self.total > (self.page * self.per_page):
-            self.search(
-                # Search parameters
-                credit_note_id = credit_note_id,
-                order_by = order_by,
-
-                fetch_all = fetch_all,
-                allow_empty_filter = allow_empty_filter,
-                keep_old_items = True,
-                page = page + 1,
-                per_page = per_page
-            )
+        if fetch_all:
+            self._load_remaining_pages(url = url, workers = fetch_all_workers)
 
 
 class CreditNoteTagsIterator(ItemsIterator):
@@ -245,6 +219,7 @@ class CreditNoteTagsIterator(ItemsIterator):
         self.search_params.order_by = order_by
 
         # Search and prepare first page as result
+        self._clear_page_cache()
         self.load_page(1)
 
 
@@ -12,7 +12,8 @@ import xml.etree.ElementTree as ET
 from munch import Munch as Bunch
 from http import Url
 import errors
-from _items_base import Item, ItemsIterator
+from _items_base import Item, Items, ItemsIterator
+from credit_note_items import _credit_note_items_etree
 
 
 def _credit_note_xml(
@@ -31,7 +32,8 @@ def _credit_note_xml(
     currency_code = None,
     net_gross = None,
     quote = None,  # float
-    invoice_id = None  # int
+    invoice_id = None,  # int
+    credit_note_items = None
 ):
     """
     Creates the XML to add or edit a credit note
@@ -109,6 +111,10 @@ def _credit_note_xml(
             new_tag.text = unicode(value)
             credit_note_tag.append(new_tag)
 
+    # Items
+    if credit_note_items:
+        credit_note_tag.append(_credit_note_items_etree(credit_note_items))
+
     xml = ET.tostring(credit_note_tag)
 
     # Finished
@@ -182,8 +188,8 @@ class CreditNote(Item):
         currency_code = None,
         net_gross = None,
         quote = None,  # float
-        invoice_id = None  # int
-        # credit_note_items = None
+        invoice_id = None,  # int
+        credit_note_items = None
     ):
         """
         Creates a credit note
@@ -208,7 +214,10 @@ class CreditNote(Item):
         :param quote: Currency quote (for conversion into standard currency)
         :param invoice_id: The ID of the invoice, if the credit note was
             created from an invoice.
-        # :param invoice_items: List with CreditNoteItem-Objects
+        :param credit_note_items: List with CreditNoteItem-Objects or
+            dictionaries (article_id, unit, quantity, unit_price, tax_name,
+            tax_rate, title, description, reduction); created with the
+            credit note
         """
 
         # XML
@@ -228,7 +237,8 @@ class CreditNote(Item):
             currency_code = currency_code,
             net_gross = net_gross,
             quote = quote,  # float
-            invoice_id = invoice_id  # int
+            invoice_id = invoice_id,  # int
+            credit_note_items = credit_note_items
         )
 
         # Send POST-request
@@ -328,7 +338,10 @@ class CreditNote(Item):
             raise errors.BillomatError(unicode(response.data, encoding = "utf-8"))
 
 
-class CreditNotes(list):
+class CreditNotes(Items):
+
+    item_class = CreditNote
+
 
     def __init__(self, conn):
         """
@@ -337,13 +350,7 @@ class CreditNotes(list):
         :param conn: Connection-Object
         """
 
-        list.__init__(self)
-
-        self.conn = conn
-        self.per_page = None
-        self.total = None
-        self.page = None
-        self.pages = None
+        Items.__init__(self, conn = conn)
 
 
     def search(
@@ -363,6 +370,7 @@ class CreditNotes(list):
 
         order_by = None,
         fetch_all = False,
+        fetch_all_workers = 1,
         allow_empty_filter = False,
         keep_old_items = False,
         page = 1,
@@ -397,6 +405,9 @@ class CreditNotes(list):
 
         :param allow_empty_filter: If `True`, every filter-parameter may be empty.
             So, all credit notes will returned. !!! EVERY CREDIT NOTE !!!
+        :param fetch_all_workers: Count of concurrent requests if *fetch_all*
+            is `True`. After the first page, all remaining pages are fetched
+            in parallel. The order of the items is preserved.
         """
         
         # Check empty filter
@@ -457,46 +468,11 @@ class CreditNotes(list):
             url.query["article_id"] = article_id
 
         # Fetch data
-        response = self.conn.get(path = str(url))
-
-        # Parse XML
-        credit_notes_etree = ET.fromstring(response.data)
-
-        self.per_page = int(credit_notes_etree.attrib.get("per_page", "100"))
-        self.total = int(credit_notes_etree.attrib.get("total", "0"))
-        self.page = int(credit_notes_etree.attrib.get("page", "1"))
-        try:
-            self.pages = (self.total // self.per_page) + int(bool(self.total % self.per_page))
-        except ZeroDivisionError:
-            self.pages = 0
-
-        # Iterate over all credit notes
-        for credit_note_etree in credit_notes_etree:
-            self.append(CreditNote(conn = self.conn, credit_note_etree = credit_note_etree))
+        self._load_page(url)
 
         # Fetch all
-        if fetch_all and self.total > (self.page * self.per_page):
-            self.search(
-                # Search parameters
-                client_id = client_id,
-                contact_id = contact_id,
-                credit_note_number = credit_note_number,
-                status = status,
-                from_date = from_date,
-                to_date = to_date,
-                label = label,
-                intro = intro,
-                note = note,
-                tags = tags,
-                article_id = article_id,
-
-                order_by = order_by,
-                fetch_all = fetch_all,
-                allow_empty_filter = allow_empty_filter,
-                keep_old_items = True,
-                page = page + 1,
-                per_page = per_page
-            )
+        if fetch_all:
+            self._load_remaining_pages(url = url, workers = fetch_all_workers)
 
 
 class CreditNotesIterator(ItemsIterator):
@@ -563,6 +539,7 @@ class CreditNotesIterator(ItemsIterator):
         self.search_params.order_by = order_by
 
         # Search and prepare first page as result
+        self._clear_page_cache()
         self.load_page(1)
 
 
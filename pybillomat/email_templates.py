@@ -11,7 +11,7 @@ import xml.etree.ElementTree as ET
 import errors
 from munch import Munch as Bunch
 from http import Url
-from _items_base import Item, ItemsIterator
+from _items_base import Item, Items, ItemsIterator
 
 
 def _email_template_xml(
@@ -191,7 +191,11 @@ class EmailTemplate(Item):
             raise errors.BillomatError(unicode(response.data, encoding = "utf-8"))
 
 
-class EmailTemplates(list):
+class EmailTemplates(Items):
+
+    item_class = EmailTemplate
+    default_per_page = 0
+
 
     def __init__(self, conn):
         """
@@ -200,13 +204,7 @@ class EmailTemplates(list):
         :param conn: Connection-Object
         """
 
-        list.__init__(self)
-
-        self.conn = conn
-        self.per_page = None
-        self.total = None
-        self.page = None
-        self.pages = None
+        Items.__init__(self, conn = conn)
 
 
     def search(
@@ -215,6 +213,7 @@ class EmailTemplates(list):
         order_by = None,
 
         fetch_all = False,
+        fetch_all_workers = 1,
         keep_old_items = False,
         page = 1,
         per_page = None
@@ -229,6 +228,9 @@ class EmailTemplates(list):
             If no order is specified, ascending order (ASC) is used.
             Nested sort orders are possible. Please separate the sort orders by
             comma.
+        :param fetch_all_workers: Count of concurrent requests if *fetch_all*
+            is `True`. After the first page, all remaining pages are fetched
+            in parallel. The order of the items is preserved.
         """
         
         # Empty the list
@@ -248,37 +250,11 @@ class EmailTemplates(list):
             url.query["order_by"] = order_by
 
         # Fetch data
-        response = self.conn.get(path = str(url))
-
-        # Parse XML
-        email_templates_etree = ET.fromstring(response.data)
-
-        self.per_page = int(email_templates_etree.attrib.get("per_page", "0"))
-        self.total = int(email_templates_etree.attrib.get("total", "0"))
-        self.page = int(email_templates_etree.attrib.get("page", "1"))
-        try:
-            self.pages = (self.total // self.per_page) + int(bool(self.total % self.per_page))
-        except ZeroDivisionError:
-            self.pages = 0
-
-        # Iterate over all email templates
-        for email_template_etree in email_templates_etree:
-            self.append(
-                EmailTemplate(
-                    conn = self.conn,
-                    email_template_etree = email_template_etree
-                )
-            )
+        self._load_page(url)
 
         # Fetch all
-        if fetch_all and self.total > (self.page * self.per_page):
-            self.search(
-                order_by = order_by,
-                fetch_all = fetch_all,
-                keep_old_items = True,
-                page = page + 1,
-                per_page = per_page
-            )
+        if fetch_all:
+            self._load_remaining_pages(url = url, workers = fetch_all_workers)
 
 
 class EmailTemplatesIterator(ItemsIterator):
@@ -311,6 +287,7 @@ class EmailTemplatesIterator(ItemsIterator):
         self.search_params.order_by = order_by
 
         # Search and prepare first page as result
+        self._clear_page_cache()
         self.load_page(1)
 
 
@@ -21,3 +21,5 @@ class NotFoundError(BillomatError):
     pass
 
 
+class CassetteError(BillomatError):
+    pass
@@ -4,36 +4,274 @@
 Connection
 """
 
+import email.utils
 import os
+import random
+import sys
+import threading
+import time
 import urllib
+import zlib
+from multiprocessing.pool import ThreadPool
+from munch import Munch as Bunch
+from metrics import get_path_template
+from response_cache import CachedResponse, create_cache_entry
 
 if "APPENGINE_RUNTIME" in os.environ:
     # Google App Engine
     from google.appengine.api import urlfetch
-    import zlib
     urllib3 = None
+    # Transient failures (retried)
+    RETRY_EXCEPTIONS = (urlfetch.DownloadError,)
+    # Failures before the request was sent (also retried for POST)
+    CONNECT_EXCEPTIONS = ()
 else:
     # Urllib3
     import urllib3
     urlfetch = None
+    # Transient failures (retried)
+    RETRY_EXCEPTIONS = (
+        urllib3.exceptions.ProtocolError,
+        urllib3.exceptions.TimeoutError,
+    )
+    # Failures before the request was sent (also retried for POST)
+    CONNECT_EXCEPTIONS = (
+        urllib3.exceptions.ConnectTimeoutError,
+    )
 import urlparse
 
 
+class RateLimiter(object):
+    """
+    Thread-safe token bucket
+
+    Every request takes one token. The bucket is refilled with *rate*
+    tokens per second up to *burst* tokens. If the server sends rate-limit
+    headers (*X-Rate-Limit-Remaining*, *X-Rate-Limit-Reset*), the remaining
+    requests are spread over the time until the reset.
+    """
+
+    # Timestamps below this value are seconds until the reset
+    min_reset_timestamp = 1000000000
+
+
+    def __init__(self, rate = None, burst = 10):
+        """
+        :param rate: Requests per second; `None` = no client-side limit
+            (only the rate-limit headers of the server are considered)
+        :param burst: Maximum count of requests which can be sent
+            without waiting
+        """
+
+        self.rate = rate
+        self.burst = max(int(burst), 1)
+        self.tokens = float(self.burst)
+        self.wait_count = 0
+        self.wait_seconds = 0.0
+
+        self._server_rate = None
+        self._server_reset = None
+        self._blocked_until = None
+        self._last_time = time.time()
+        self._lock = threading.Lock()
+
+
+    def _get_rate(self, now):
+        """
+        Returns the effective rate (tokens per second) or `None`
+        """
+
+        # Server rate expired
+        if self._server_reset is not None and now >= self._server_reset:
+            self._server_rate = None
+            self._server_reset = None
+
+        rates = [rate for rate in (self.rate, self._server_rate) if rate]
+        if rates:
+            return min(rates)
+
+
+    def acquire(self):
+        """
+        Takes one token; blocks until a token is available
+        """
+
+        while True:
+            with self._lock:
+                now = time.time()
+                if self._blocked_until is not None:
+                    if now < self._blocked_until:
+                        wait_seconds = self._blocked_until - now
+                    else:
+                        self._blocked_until = None
+                        self.tokens = float(self.burst)
+                        wait_seconds = None
+                else:
+                    wait_seconds = None
+
+                if wait_seconds is None:
+                    rate = self._get_rate(now)
+                    if rate is None:
+                        self._last_time = now
+                        return
+                    self.tokens = min(
+                        self.burst,
+                        self.tokens + (now - self._last_time) * rate
+                    )
+                    self._last_time = now
+                    if self.tokens >= 1:
+                        self.tokens -= 1
+                        return
+                    wait_seconds = (1 - self.tokens) / rate
+
+                self.wait_count += 1
+                self.wait_seconds += wait_seconds
+
+            # Wait outside of the lock
+            time.sleep(wait_seconds)
+
+
+    def update_from_headers(self, headers):
+        """
+        Adapts the rate to the rate-limit headers of a response
+        """
+
+        if not headers:
+            return
+        remaining = headers.get("X-Rate-Limit-Remaining")
+        reset = headers.get("X-Rate-Limit-Reset")
+        if remaining is None or reset is None:
+            return
+        try:
+            remaining = int(remaining)
+            reset = float(reset)
+        except ValueError:
+            return
+
+        now = time.time()
+        if reset < self.min_reset_timestamp:
+            reset += now
+        seconds = max(reset - now, 1.0)
+
+        with self._lock:
+            if remaining <= 0:
+                # Quota exhausted: wait until the reset
+                self._blocked_until = reset
+                self.tokens = 0.0
+            else:
+                self._server_rate = remaining / seconds
+                self._server_reset = reset
+                self.tokens = min(self.tokens, float(remaining))
+
+
 class Connection(object):
 
+    # Response status codes which are retried
+    retry_statuses = (429, 502, 503, 504)
+
+
     def __init__(
         self,
         billomat_id,
         billomat_api_key,
         billomat_app_id = None,
         billomat_app_secret = None,
-        timeout_seconds = 600  # 10 Minutes
+        timeout_seconds = 600,  # 10 Minutes
+        rate_limit = None,
+        rate_limit_burst = 10,
+        retries = 3,
+        retry_backoff_seconds = 0.5,
+        retry_backoff_max_seconds = 60,
+        retry_post = False,
+        pool_maxsize = 10,
+        pool_block = True,
+        connect_timeout_seconds = None,
+        read_timeout_seconds = None,
+        gzip_min_body_size = None,
+        response_cache = None,
+        identity_map = None,
+        base_url = None,
+        cassette = None,
+        hooks = None,
+        time_parsing = False
     ):
+        """
+        :param rate_limit: Maximum requests per second (client-side);
+            `None` = only the rate-limit headers of the server are considered
+        :param rate_limit_burst: Maximum count of requests which can be sent
+            without waiting
+        :param retries: Maximum count of retries per request after
+            transient failures (dropped connection, timeout, 429, 502,
+            503, 504)
+        :param retry_backoff_seconds: Base of the exponential backoff;
+            the waiting time is chosen randomly between 0 and
+            `retry_backoff_seconds * 2 ** (retry - 1)` (full jitter).
+            A *Retry-After* header of the server takes precedence.
+        :param retry_backoff_max_seconds: Maximum waiting time per retry
+        :param retry_post: If `True`, POST-requests are retried, too.
+            POST-requests are not idempotent; they are retried by default
+            only, if the server has not received or not processed them
+            (connect failure, status 429).
+        :param pool_maxsize: Maximum count of keep-alive connections
+            to the server; should be at least the count of threads which
+            use this connection at the same time
+        :param pool_block: If `True`, a thread waits for a free connection
+            when *pool_maxsize* connections are in use. If `False`, an
+            additional connection is opened and discarded after the request.
+        :param connect_timeout_seconds: Timeout for establishing a
+            connection; default: *timeout_seconds*
+        :param read_timeout_seconds: Timeout for reading from the server;
+            default: *timeout_seconds*
+        :param gzip_min_body_size: If set, request bodies (POST/PUT/DELETE)
+            with at least this count of bytes are sent gzip-compressed;
+            `None` = request bodies are never compressed
+        :param response_cache: Cache for conditional GET-requests
+            (*MemoryResponseCache* or *DiskResponseCache*); `None` = no cache
+        :param identity_map: *IdentityMap* with the data of loaded
+            Item-objects; `None` = Item-objects are always loaded from server
+        :param base_url: URL of the server, e.g. "http://127.0.0.1:8080/"
+            for a local test server; default:
+            "https://<billomat_id>.billomat.net/"
+        :param cassette: *Cassette* which records all requests or replays
+            them without network I/O; `None` = no cassette
+        :param hooks: List with callables; every hook is called with an
+            event (Bunch) per request and per parsed response
+            (see *pybillomat.metrics*, e.g. *EndpointMetrics*)
+        :param time_parsing: If `True` and hooks are set, streamed
+            responses are read completely before they are parsed, so the
+            parse events contain the pure parsing time. If `False`, the
+            parsing time of streamed responses includes reading the body.
+        """
 
         self.timeout_seconds = timeout_seconds
+        self.gzip_min_body_size = gzip_min_body_size
+        self.response_cache = response_cache
+        self.identity_map = identity_map
+        self.cassette = cassette
+        self.hooks = list(hooks or [])
+        self.time_parsing = time_parsing
+
+        # Retry policy
+        self.retries = retries
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self.retry_backoff_max_seconds = retry_backoff_max_seconds
+        self.retry_post = retry_post
+
+        # Retry statistics
+        self.retry_count = 0
+        self.backoff_seconds = 0.0
+        self._stats_lock = threading.Lock()
+
+        # Retries of the current request (per thread)
+        self._local = threading.local()
+
+        # Rate limiter (used by all requests)
+        self.rate_limiter = RateLimiter(
+            rate = rate_limit, burst = rate_limit_burst
+        )
 
         # Base URL
-        self.url = "https://{billomat_id}.billomat.net/".format(
+        self.url = base_url or "https://{billomat_id}.billomat.net/".format(
             billomat_id = billomat_id
         )
 
@@ -52,89 +290,411 @@ class Connection(object):
 
         # Initialize Urllib3-ConnectionPool
         if urllib3:
-            scheme, host, port = urllib3.get_host(self.url)
-
 
             # ToDo: certifi einbauen und testen
             # https://urllib3.readthedocs.org/en/latest/security.html#using-certifi-with-urllib3
             # https://github.com/gerold-penz/python-billomat/issues/1
 
 
-            self.conn = urllib3.HTTPSConnectionPool(
-                host = host, port = port, timeout = self.timeout_seconds
+            # HTTPS- or HTTP-ConnectionPool (depends on the scheme)
+            self.conn = urllib3.connection_from_url(
+                self.url,
+                timeout = urllib3.Timeout(
+                    connect = connect_timeout_seconds or self.timeout_seconds,
+                    read = read_timeout_seconds or self.timeout_seconds
+                ),
+                maxsize = pool_maxsize,
+                block = pool_block
             )
 
         else:
             self.conn = None
 
 
-    def get(self, path):
+    def get_pool_stats(self):
+        """
+        Returns the usage of the connection pool
+
+        :returns: Dictionary with the count of *requests*, the count of
+            *created_connections* and the count of *reused_connections*.
+            (Google App Engine: `None`)
+        """
+
+        if not self.conn:
+            return
+        requests = self.conn.num_requests
+        created_connections = self.conn.num_connections
+        return {
+            "requests": requests,
+            "created_connections": created_connections,
+            "reused_connections": max(requests - created_connections, 0),
+        }
+
+
+    def _get_retry_after_seconds(self, response):
+        """
+        Returns the seconds of the *Retry-After* header or `None`
+        """
+
+        retry_after = response.headers.get("Retry-After")
+        if not retry_after:
+            return
+        try:
+            seconds = float(retry_after)
+        except ValueError:
+            # HTTP-date
+            parsed = email.utils.parsedate_tz(retry_after)
+            if not parsed:
+                return
+            seconds = email.utils.mktime_tz(parsed) - time.time()
+        return max(seconds, 0.0)
+
+
+    def _get_backoff_seconds(self, retry, retry_after_seconds = None):
+        """
+        Returns the waiting time before the retry (exponential with jitter)
+        """
+
+        if retry_after_seconds is not None:
+            seconds = retry_after_seconds
+        else:
+            seconds = random.uniform(
+                0, self.retry_backoff_seconds * 2 ** (retry - 1)
+            )
+        return min(seconds, self.retry_backoff_max_seconds)
+
+
+    def _discard(self, response):
+        """
+        Reads the rest of a response and releases its connection
+        """
+
+        if not self.conn or isinstance(response, CachedResponse):
+            return
+        try:
+            response.read()
+        except RETRY_EXCEPTIONS:
+            pass
+        response.release_conn()
+
+
+    def _request(self, method, send):
+        """
+        Sends a request with `send()`; retries transient failures
+
+        :returns: response
+        """
+
+        retryable = method != "POST" or self.retry_post
+        retry = 0
+
+        while True:
+            self._local.retries = retry
+            self.rate_limiter.acquire()
+            try:
+                response = send()
+            except RETRY_EXCEPTIONS as err:
+                if retry >= self.retries:
+                    raise
+                if not retryable and not isinstance(err, CONNECT_EXCEPTIONS):
+                    raise
+                retry_after_seconds = None
+            else:
+                self.rate_limiter.update_from_headers(response.headers)
+                if (
+                    response.status not in self.retry_statuses or
+                    retry >= self.retries or
+                    (not retryable and response.status != 429)
+                ):
+                    return response
+                retry_after_seconds = self._get_retry_after_seconds(response)
+                self._discard(response)
+
+            # Wait before the next try
+            retry += 1
+            backoff_seconds = self._get_backoff_seconds(
+                retry = retry, retry_after_seconds = retry_after_seconds
+            )
+            with self._stats_lock:
+                self.retry_count += 1
+                self.backoff_seconds += backoff_seconds
+            time.sleep(backoff_seconds)
+
+
+    def _call_hooks(self, event):
+        for hook in self.hooks:
+            hook(event)
+
+
+    def report_parse(
+        self, path, seconds, item_count, method = "GET", bytes_received = None
+    ):
+        """
+        Calls the hooks with a parse event
+        (called by the Item- and Items-classes)
+
+        :param seconds: Parsing time of the response
+        :param item_count: Count of parsed objects
+        :param bytes_received: Size of the body of a streamed response
+            (read while parsing); `None` for preloaded responses
+        """
+
+        if not self.hooks:
+            return
+        self._call_hooks(Bunch(
+            kind = "parse",
+            method = method,
+            path = path,
+            path_template = get_path_template(path),
+            seconds = seconds,
+            item_count = item_count,
+            bytes_received = bytes_received,
+        ))
+
+
+    def _send(self, method, path, body, send, bytes_sent = None, stream = False):
+        """
+        Sends the request with *_request()* or replays it from the cassette;
+        records it into the cassette and calls the hooks
+
+        :param body: Uncompressed body
+        :param bytes_sent: Size of the sent (compressed) body
+        :param stream: If `True`, the body of the response isn't
+            read here (unless the cassette or *time_parsing* needs it)
+
+        :returns: response
+        """
+
+        if self.cassette is None and not self.hooks:
+            return self._request(method = method, send = send)
+
+        event = Bunch(
+            kind = "request",
+            method = method,
+            path = path,
+            path_template = get_path_template(path),
+            status = None,
+            error = None,
+            bytes_sent = bytes_sent,
+            bytes_received = None,
+            ttfb_seconds = None,
+            total_seconds = None,
+            retries = 0,
+            cache_hit = False,
+            replayed = False,
+            streamed = False,
+        )
+        start = time.time()
+        try:
+            if self.cassette is not None and self.cassette.mode == "replay":
+                # Replay (no network I/O)
+                response = self.cassette.replay(method, path, body)
+                event.replayed = True
+                event.ttfb_seconds = time.time() - start
+            else:
+                response = self._request(method = method, send = send)
+                event.ttfb_seconds = time.time() - start
+                event.retries = self._local.retries
+                if (
+                    self.cassette is not None or
+                    not stream or
+                    (self.hooks and self.time_parsing)
+                ):
+                    # Read the body
+                    data = response.data
+                    seconds = time.time() - start
+                    if self.conn:
+                        response.release_conn()
+                    if self.cassette is not None:
+                        # Record
+                        response = self.cassette.record(
+                            method, path, body, response.status,
+                            response.headers, data, seconds
+                        )
+                    else:
+                        response = CachedResponse(
+                            data = data,
+                            headers = response.headers,
+                            status = response.status
+                        )
+                else:
+                    event.streamed = True
+        except Exception as err:
+            if not self.hooks:
+                raise
+            exc_info = sys.exc_info()
+            event.error = err
+            event.retries = getattr(self._local, "retries", 0)
+            event.total_seconds = time.time() - start
+            self._call_hooks(event)
+            raise exc_info[0], exc_info[1], exc_info[2]
+
+        if self.hooks:
+            event.status = response.status
+            event.total_seconds = time.time() - start
+            event.cache_hit = response.status == 304
+            if not event.streamed:
+                event.bytes_received = len(response.data or "")
+            self._call_hooks(event)
+
+        return response
+
+
+    def _prepare_urlfetch_response(self, response):
+        """
+        Google App Engine: Adds *status* and the decompressed *data*
+        to an urlfetch-response
+        """
+
+        response.status = response.status_code
+        response.data = response.content
+
+        # Decompress
+        if "gzip" in response.headers.get("content-encoding", ""):
+            response.data = zlib.decompressobj(16 + zlib.MAX_WBITS) \
+                .decompress(response.content)
+
+        # Finished
+        return response
+
+
+    def get(self, path, stream = False):
         """
         GET-Request (allowes gzipped response)
 
+        :param stream: If `True`, the body of the response is not
+            preloaded. It can be read incrementally with
+            `response.stream()` or `response.read()`. The connection must
+            be released with `response.release_conn()` afterwards.
+            (Google App Engine: Ignored; the body is always preloaded.)
+            Responses, which are stored in the *response_cache*, are
+            always preloaded.
+
         :returns: response
         """
 
         headers = self.headers.copy()
         headers["Accept-Encoding"] = "gzip"
 
+        # Conditional request
+        cache_entry = None
+        if self.response_cache is not None:
+            cache_key = urllib.basejoin(self.url, path)
+            cache_entry = self.response_cache.get(cache_key)
+            if cache_entry:
+                if cache_entry["etag"]:
+                    headers["If-None-Match"] = cache_entry["etag"]
+                if cache_entry["last_modified"]:
+                    headers["If-Modified-Since"] = cache_entry["last_modified"]
+
         if self.conn:
             # Urllib3
-            response = self.conn.request(method = "GET", url = path, headers = headers)
-            return response
+            def send():
+                return self.conn.request(
+                    method = "GET",
+                    url = path,
+                    headers = headers,
+                    preload_content = not (stream or self.hooks),
+                    retries = False
+                )
         else:
             # Google App Engine
-            response = self.urlfetch.fetch(
-                url = urllib.basejoin(self.url, path),
-                method = "GET", headers = headers,
-                deadline = self.timeout_seconds
+            def send():
+                response = self.urlfetch.fetch(
+                    url = urllib.basejoin(self.url, path),
+                    method = "GET", headers = headers,
+                    deadline = self.timeout_seconds
+                )
+                return self._prepare_urlfetch_response(response)
+
+        response = self._send("GET", path, None, send, stream = stream)
+        if self.response_cache is None:
+            return response
+
+        # Not modified --> cached body
+        if response.status == 304 and cache_entry:
+            self._discard(response)
+            return CachedResponse(
+                data = cache_entry["data"], headers = cache_entry["headers"]
             )
-            response.status = response.status_code
-            response.data = response.content
 
-            # Decompress
-            if "gzip" in response.headers.get("content-encoding", ""):
-                response.data = zlib.decompressobj(16 + zlib.MAX_WBITS) \
-                    .decompress(response.content)
+        # Store response
+        if response.status == 200:
+            cache_entry = create_cache_entry(response)
+            if cache_entry:
+                self._discard(response)
+                self.response_cache.set(cache_key, cache_entry)
+                return CachedResponse(
+                    data = cache_entry["data"],
+                    headers = cache_entry["headers"]
+                )
 
-            # Finished
-            return response
+        return response
 
 
     def _request_with_body(self, method, path, body):
         """
-        POST/PUT/DELETE-Request (no gzipped response)
+        POST/PUT/DELETE-Request (allowes gzipped response)
+
+        Large bodies are gzip-compressed (see *gzip_min_body_size*).
 
         :returns: response
         """
 
-        headers = self.headers
+        headers = self.headers.copy()
+        headers["Accept-Encoding"] = "gzip"
+
+        if isinstance(body, unicode):
+            body = body.encode("utf-8")
+
+        # Changed object --> remove it from the identity map
+        if self.identity_map is not None:
+            self.identity_map.discard_path(path)
+
+        # Uncompressed body (for the cassette)
+        raw_body = body
+
+        # Compress body
+        if body and self.gzip_min_body_size is not None:
+            if len(body) >= self.gzip_min_body_size:
+                compressor = zlib.compressobj(
+                    6, zlib.DEFLATED, 16 + zlib.MAX_WBITS
+                )
+                body = compressor.compress(body) + compressor.flush()
+                headers["Content-Encoding"] = "gzip"
 
         if self.conn:
             # Urllib3
-            return self.conn.urlopen(
-                method = method,
-                url = path,
-                body = body,
-                headers = headers
-            )
+            def send():
+                return self.conn.urlopen(
+                    method = method,
+                    url = path,
+                    body = body,
+                    headers = headers,
+                    preload_content = not self.hooks,
+                    retries = False
+                )
         else:
             # Google App Engine
-            response = self.urlfetch.fetch(
-                url = urllib.basejoin(self.url, path),
-                payload = body,
-                method = method,
-                headers = headers,
-                deadline = self.timeout_seconds
-            )
-            response.status = response.status_code
-            response.data = response.content
-            return response
+            def send():
+                response = self.urlfetch.fetch(
+                    url = urllib.basejoin(self.url, path),
+                    payload = body,
+                    method = method,
+                    headers = headers,
+                    deadline = self.timeout_seconds
+                )
+                return self._prepare_urlfetch_response(response)
+
+        return self._send(
+            method, path, raw_body, send,
+            bytes_sent = len(body) if body else 0
+        )
 
 
     def post(self, path, body):
         """
-        POST-Request (no gzipped response)
+        POST-Request (allowes gzipped response)
 
         :returns: response
         """
@@ -144,7 +704,7 @@ class Connection(object):
 
     def put(self, path, body):
         """
-        PUT-Request (no gzipped response)
+        PUT-Request (allowes gzipped response)
 
         :returns: response
         """
@@ -154,7 +714,7 @@ class Connection(object):
 
     def delete(self, path, body = None):
         """
-        DELETE-Request (no gzipped response)
+        DELETE-Request (allowes gzipped response)
 
         :returns: response
         """
@@ -162,6 +722,102 @@ class Connection(object):
         return self._request_with_body(method = "DELETE", path = path, body = body)
 
 
+class AsyncConnection(Connection):
+    """
+    Connection with a thread pool for concurrent requests
+
+    *get_async*, *post_async*, *put_async* and *delete_async* return
+    immediately with an *AsyncResult*-object. Its method *get()* waits for
+    the response. The synchronous methods are inherited, so an
+    AsyncConnection can be used wherever a Connection is expected.
+    All threads share the connection pool, the rate limiter and the
+    retry policy.
+    """
+
+    def __init__(self, *args, **kwargs):
+        """
+        Same parameters as *Connection*, additionally:
+
+        :param workers: Maximum count of concurrent requests
+        """
+
+        self.workers = kwargs.pop("workers", 10)
+
+        # One keep-alive connection per worker
+        kwargs.setdefault("pool_maxsize", self.workers)
+
+        Connection.__init__(self, *args, **kwargs)
+        self._pool = None
+        self._pool_lock = threading.Lock()
+
+
+    def submit(self, function, *args, **kwargs):
+        """
+        Calls *function* in a thread of the pool
+
+        :returns: AsyncResult
+        """
+
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ThreadPool(processes = self.workers)
+            pool = self._pool
+        return pool.apply_async(function, args, kwargs)
+
+
+    def get_async(self, path, stream = False):
+        """
+        GET-Request in the background
+
+        :returns: AsyncResult
+        """
+
+        return self.submit(self.get, path = path, stream = stream)
+
+
+    def post_async(self, path, body):
+        """
+        POST-Request in the background
+
+        :returns: AsyncResult
+        """
+
+        return self.submit(self.post, path = path, body = body)
+
+
+    def put_async(self, path, body):
+        """
+        PUT-Request in the background
+
+        :returns: AsyncResult
+        """
+
+        return self.submit(self.put, path = path, body = body)
+
+
+    def delete_async(self, path, body = None):
+        """
+        DELETE-Request in the background
+
+        :returns: AsyncResult
+        """
+
+        return self.submit(self.delete, path = path, body = body)
+
+
+    def close(self):
+        """
+        Waits for all pending requests and stops the threads
+        """
+
+        with self._pool_lock:
+            pool = self._pool
+            self._pool = None
+        if pool is not None:
+            pool.close()
+            pool.join()
+
+
 class Url(object):
     """
     Repräsentiert eine URL, wie sie im Onlineshop üblich ist.
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+# coding: utf-8
+"""
+Identity map
+
+Keeps the loaded data of Item-objects per *Connection*, so the same
+client, article, ... is not loaded again and again from the server.
+"""
+
+import collections
+import re
+import threading
+import time
+
+
+# "/api/invoices/123" or "/api/invoices/123/complete"
+_PATH_ID_PATTERN = re.compile(r"^(/api/[^/?]+)/(\d+)(?:[/?]|$)")
+
+
+class IdentityMap(object):
+    """
+    Thread-safe map ``(base_path, id) --> field values`` with
+    time-to-live and LRU eviction
+    """
+
+    def __init__(self, max_size = 10000, ttl_seconds = 300):
+        """
+        :param max_size: Maximum count of entries; the least recently used
+            entries are removed if the map is full
+        :param ttl_seconds: Entries older than this are not used any more;
+            `None` = entries never expire
+        """
+
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+
+    def get(self, key):
+        """
+        Returns the field values for *key* or `None`
+        """
+
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                stored, fields = entry
+                if (
+                    self.ttl_seconds is None or
+                    time.time() - stored < self.ttl_seconds
+                ):
+                    self._entries[key] = entry
+                    self.hits += 1
+                    return fields
+            self.misses += 1
+
+
+    def set(self, key, fields):
+        """
+        Stores the field values for *key*
+        """
+
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (time.time(), fields)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last = False)
+
+
+    def discard(self, key):
+        """
+        Removes the entry for *key*
+        """
+
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+    def discard_path(self, path):
+        """
+        Removes the entry of the object addressed by an API-path,
+        e.g. "/api/invoices/123/complete"
+        """
+
+        match = _PATH_ID_PATTERN.match(path)
+        if match:
+            base_path, id = match.groups()
+            self.discard((base_path, int(id)))
+
+
+    def clear(self):
+        """
+        Removes all entries
+        """
+
+        with self._lock:
+            self._entries.clear()
+
+
+    def __len__(self):
+        return len(self._entries)
@@ -12,7 +12,7 @@ import errors
 import xml.etree.ElementTree as ET
 from munch import Munch as Bunch
 from http import Url
-from _items_base import Item, ItemsIterator
+from _items_base import Item, Items, ItemsIterator
 
 
 def _invoice_item_xml(
@@ -25,10 +25,13 @@ def _invoice_item_xml(
     tax_rate = None,
     title = None,
     description = None,
-    reduction = None
+    reduction = None,
+    as_etree = False
 ):
     """
     Creates the XML to add or edit an invoice-item
+
+    :param as_etree: If `True`, the XML-element is returned
     """
 
     integer_field_names = [
@@ -74,12 +77,39 @@ def _invoice_item_xml(
             new_tag.text = unicode(value)
             invoice_item_tag.append(new_tag)
 
+    if as_etree:
+        return invoice_item_tag
+
     xml = ET.tostring(invoice_item_tag)
 
     # Finished
     return xml
 
 
+def _invoice_items_etree(invoice_items):
+    """
+    Creates the <invoice-items>-element with the items of a new invoice
+
+    :param invoice_items: List with InvoiceItem-Objects or dictionaries
+    """
+
+    invoice_items_tag = ET.Element("invoice-items")
+    for invoice_item in invoice_items:
+        invoice_items_tag.append(_invoice_item_xml(
+            article_id = invoice_item.get("article_id"),
+            unit = invoice_item.get("unit"),
+            quantity = invoice_item.get("quantity"),
+            unit_price = invoice_item.get("unit_price"),
+            tax_name = invoice_item.get("tax_name"),
+            tax_rate = invoice_item.get("tax_rate"),
+            title = invoice_item.get("title"),
+            description = invoice_item.get("description"),
+            reduction = invoice_item.get("reduction"),
+            as_etree = True
+        ))
+    return invoice_items_tag
+
+
 class InvoiceItem(Item):
 
     base_path = u"/api/invoice-items"
@@ -241,7 +271,10 @@ class InvoiceItem(Item):
             raise errors.BillomatError(unicode(response.data, encoding = "utf-8"))
 
 
-class InvoiceItems(list):
+class InvoiceItems(Items):
+
+    item_class = InvoiceItem
+
 
     def __init__(self, conn):
         """
@@ -250,13 +283,7 @@ class InvoiceItems(list):
         :param conn: Connection-Object
         """
 
-        list.__init__(self)
-
-        self.conn = conn
-        self.per_page = None
-        self.total = None
-        self.page = None
-        self.pages = None
+        Items.__init__(self, conn = conn)
 
 
     def search(
@@ -266,6 +293,7 @@ class InvoiceItems(list):
 
         order_by = None,
         fetch_all = False,
+        fetch_all_workers = 1,
         keep_old_items = False,
         page = 1,
         per_page = None,
@@ -286,6 +314,9 @@ class InvoiceItems(list):
             If no order is specified, ascending order (ASC) is used.
             Nested sort orders are possible. Please separate the sort orders by
             comma.
+        :param fetch_all_workers: Count of concurrent requests if *fetch_all*
+            is `True`. After the first page, all remaining pages are fetched
+            in parallel. The order of the items is preserved.
         """
 
         # Check empty param
@@ -315,37 +346,11 @@ class InvoiceItems(list):
         url.query["invoice_id"] = invoice_id
 
         # Fetch data
-        response = self.conn.get(path = str(url))
-
-        # Parse XML
-        invoice_items_etree = ET.fromstring(response.data)
-
-        self.per_page = int(invoice_items_etree.attrib.get("per_page", "100"))
-        self.total = int(invoice_items_etree.attrib.get("total", "0"))
-        self.page = int(invoice_items_etree.attrib.get("page", "1"))
-        try:
-            self.pages = (self.total // self.per_page) + int(bool(self.total % self.per_page))
-        except ZeroDivisionError:
-            self.pages = 0
-
-        # Iterate over all items
-        for invoice_item_etree in invoice_items_etree:
-            self.append(
-                InvoiceItem(conn = self.conn, invoice_item_etree = invoice_item_etree)
-            )
+        self._load_page(url)
 
         # Fetch all
-        if fetch_all and self.total > (self.page * self.per_page):
-            self.search(
-                # Search parameters
-                invoice_id = invoice_id,
-
-                order_by = order_by,
-                fetch_all = fetch_all,
-                keep_old_items = True,
-                page = page + 1,
-                per_page = per_page
-            )
+        if fetch_all:
+            self._load_remaining_pages(url = url, workers = fetch_all_workers)
 
 
 class InvoiceItemsIterator(ItemsIterator):
@@ -387,6 +392,7 @@ class InvoiceItemsIterator(ItemsIterator):
         self.search_params.order_by = order_by
 
         # Search and prepare first page as result
+        self._clear_page_cache()
         self.load_page(1)
 
 
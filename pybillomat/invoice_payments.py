@@ -7,12 +7,11 @@ Invoice-Payments
 - Deutsche API-Beschreibung: http://www.billomat.com/de/api/rechnungen/zahlungen
 """
 
-import urllib3
 import xml.etree.ElementTree as ET
 import errors
 from munch import Munch as Bunch
 from http import Url
-from _items_base import Item, ItemsIterator
+from _items_base import Item, Items, ItemsIterator
 
 
 def _invoice_payment_xml(
@@ -187,7 +186,11 @@ class InvoicePayment(Item):
         return invoice_payment
 
 
-class InvoicePayments(list):
+class InvoicePayments(Items):
+
+    item_class = InvoicePayment
+    default_per_page = 0
+
 
     def __init__(self, conn):
         """
@@ -196,13 +199,27 @@ class InvoicePayments(list):
         :param conn: Connection-Object
         """
 
-        list.__init__(self)
+        Items.__init__(self, conn = conn)
 
-        self.conn = conn
-        self.per_page = None
-        self.total = None
-        self.page = None
-        self.pages = None
+
+    def _check_response(self, response, url):
+        """
+        Raises an error if the server couldn't deliver the page
+        """
+
+        if response.status != 200:
+            # Check if "Unothorized" --> raise NotFoundError
+            errors_etree = ET.fromstring(response.data)
+            for error_etree in errors_etree:
+                text = error_etree.text
+                if text.lower() == "unauthorized":
+                    raise errors.NotFoundError(
+                        u"invoice_id: {invoice_id}".format(
+                            invoice_id = url.query.get("invoice_id")
+                        )
+                    )
+            # Other Error
+            raise errors.BillomatError(response.data)
 
 
     def search(
@@ -216,6 +233,7 @@ class InvoicePayments(list):
         order_by = None,
 
         fetch_all = False,
+        fetch_all_workers = 1,
         allow_empty_filter = False,
         keep_old_items = False,
         page = 1,
@@ -246,6 +264,9 @@ class InvoicePayments(list):
 
         :param allow_empty_filter: If `True`, every filter-parameter may be empty.
             All invoice-payments will returned. !!! EVERY !!!
+        :param fetch_all_workers: Count of concurrent requests if *fetch_all*
+            is `True`. After the first page, all remaining pages are fetched
+            in parallel. The order of the items is preserved.
         """
 
         # Check empty filter
@@ -288,63 +309,12 @@ class InvoicePayments(list):
             url.query["user_id"] = user_id
 
         # Fetch data
-        response = self.conn.get(path = str(url))
-        if response.status != 200:
-            # Check if "Unothorized" --> raise NotFoundError
-            errors_etree = ET.fromstring(response.data)
-            for error_etree in errors_etree:
-                text = error_etree.text
-                if text.lower() == "unauthorized":
-                    raise errors.NotFoundError(
-                        u"invoice_id: {invoice_id}".format(invoice_id = invoice_id)
-                    )
-            # Other Error
-            raise errors.BillomatError(response.data)
-
-        # No response (workaround for inconsistent gziped answer; DecodeError)
-        try:
-            if len(response.data) == 0:
-                return
-        except urllib3.exceptions.DecodeError:
-            if response.headers.get("content-type", "").lower() != "application/xml":
-                return
-            else:
-                raise
-
-        # Parse XML
-        payments_etree = ET.fromstring(response.data)
-
-        self.per_page = int(payments_etree.attrib.get("per_page", "0"))
-        self.total = int(payments_etree.attrib.get("total", "0"))
-        self.page = int(payments_etree.attrib.get("page", "1"))
-        try:
-            self.pages = (self.total // self.per_page) + int(bool(self.total % self.per_page))
-        except ZeroDivisionError:
-            self.pages = 0
-
-        # Iterate over all payments
-        for payment_etree in payments_etree:
-            self.append(
-                InvoicePayment(conn = self.conn, payment_etree = payment_etree)
-            )
+        if not self._load_page(url):
+            return
 
         # Fetch all
-        if fetch_all and self.total > (self.page * self.per_page):
-            self.search(
-                # Search parameters
-                invoice_id = invoice_id,
-                from_date = from_date,
-                to_date = to_date,
-                type = type,
-                user_id = user_id,
-                order_by = order_by,
-
-                fetch_all = fetch_all,
-                allow_empty_filter = allow_empty_filter,
-                keep_old_items = True,
-                page = page + 1,
-                per_page = per_page
-            )
+        if fetch_all:
+            self._load_remaining_pages(url = url, workers = fetch_all_workers)
 
 
 class InvoicePaymentsIterator(ItemsIterator):
@@ -392,6 +362,7 @@ class InvoicePaymentsIterator(ItemsIterator):
         self.search_params.order_by = order_by
 
         # Search and prepare first page as result
+        self._clear_page_cache()
         self.load_page(1)
 
 
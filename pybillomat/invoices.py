@@ -12,7 +12,8 @@ import xml.etree.ElementTree as ET
 from munch import Munch as Bunch
 from http import Url
 import errors
-from _items_base import Item, ItemsIterator
+from _items_base import Item, Items, ItemsIterator
+from invoice_items import _invoice_items_etree
 
 
 def _invoice_xml(
@@ -41,6 +42,7 @@ def _invoice_xml(
     offer_id = None,
     confirmation_id = None,
     recurring_id = None,
+    invoice_items = None
 ):
     """
     Creates the XML to add or edit an invoice
@@ -127,6 +129,10 @@ def _invoice_xml(
             new_tag.text = unicode(value)
             invoice_tag.append(new_tag)
 
+    # Items
+    if invoice_items:
+        invoice_tag.append(_invoice_items_etree(invoice_items))
+
     xml = ET.tostring(invoice_tag)
 
     # Finished
@@ -377,7 +383,7 @@ class Invoice(Item):
         offer_id = None,
         confirmation_id = None,
         recurring_id = None,
-        # invoice_items = None
+        invoice_items = None
     ):
         """
         Creates an invoice
@@ -416,7 +422,9 @@ class Invoice(Item):
             created from a confirmation.
         :param recurring_id: The ID of the recurring, if the invoice was
             created from a recurring.
-        # :param invoice_items: List with InvoiceItem-Objects
+        :param invoice_items: List with InvoiceItem-Objects or dictionaries
+            (article_id, unit, quantity, unit_price, tax_name, tax_rate,
+            title, description, reduction); created with the invoice
         """
 
         # XML
@@ -445,7 +453,8 @@ class Invoice(Item):
             invoice_id = invoice_id,
             offer_id = offer_id,
             confirmation_id = confirmation_id,
-            recurring_id = recurring_id
+            recurring_id = recurring_id,
+            invoice_items = invoice_items
         )
 
         # Send POST-request
@@ -585,7 +594,10 @@ class Invoice(Item):
     #     ...
 
 
-class Invoices(list):
+class Invoices(Items):
+
+    item_class = Invoice
+
 
     def __init__(self, conn):
         """
@@ -594,13 +606,7 @@ class Invoices(list):
         :param conn: Connection-Object
         """
 
-        list.__init__(self)
-
-        self.conn = conn
-        self.per_page = None
-        self.total = None
-        self.page = None
-        self.pages = None
+        Items.__init__(self, conn = conn)
 
 
     def search(
@@ -621,6 +627,7 @@ class Invoices(list):
 
         order_by = None,
         fetch_all = False,
+        fetch_all_workers = 1,
         allow_empty_filter = False,
         keep_old_items = False,
         page = 1,
@@ -659,6 +666,9 @@ class Invoices(list):
 
         :param allow_empty_filter: If `True`, every filter-parameter may be empty.
             So, all invoices will returned. !!! EVERY INVOICE !!!
+        :param fetch_all_workers: Count of concurrent requests if *fetch_all*
+            is `True`. After the first page, all remaining pages are fetched
+            in parallel. The order of the items is preserved.
         """
         
         # Check empty filter
@@ -722,47 +732,11 @@ class Invoices(list):
             url.query["article_id"] = article_id
 
         # Fetch data
-        response = self.conn.get(path = str(url))
-
-        # Parse XML
-        invoices_etree = ET.fromstring(response.data)
-
-        self.per_page = int(invoices_etree.attrib.get("per_page", "100"))
-        self.total = int(invoices_etree.attrib.get("total", "0"))
-        self.page = int(invoices_etree.attrib.get("page", "1"))
-        try:
-            self.pages = (self.total // self.per_page) + int(bool(self.total % self.per_page))
-        except ZeroDivisionError:
-            self.pages = 0
-
-        # Iterate over all invoices
-        for invoice_etree in invoices_etree:
-            self.append(Invoice(conn = self.conn, invoice_etree = invoice_etree))
+        self._load_page(url)
 
         # Fetch all
-        if fetch_all and self.total > (self.page * self.per_page):
-            self.search(
-                # Search parameters
-                client_id = client_id,
-                contact_id = contact_id,
-                invoice_number = invoice_number,
-                status = status,
-                payment_type = payment_type,
-                from_date = from_date,
-                to_date = to_date,
-                label = label,
-                intro = intro,
-                note = note,
-                tags = tags,
-                article_id = article_id,
-
-                order_by = order_by,
-                fetch_all = fetch_all,
-                allow_empty_filter = allow_empty_filter,
-                keep_old_items = True,
-                page = page + 1,
-                per_page = per_page
-            )
+        if fetch_all:
+            self._load_remaining_pages(url = url, workers = fetch_all_workers)
 
 
 class InvoicesIterator(ItemsIterator):
@@ -831,6 +805,7 @@ class InvoicesIterator(ItemsIterator):
         self.search_params.order_by = order_by
 
         # Search and prepare first page as result
+        self._clear_page_cache()
         self.load_page(1)
 
 
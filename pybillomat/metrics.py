@@ -0,0 +1,214 @@
+#!/usr/bin/env python
+# coding: utf-8
+"""
+Request metrics
+
+*Connection* calls its hooks with one event (Bunch) per request and,
+while the responses are parsed, with one event per parsed response.
+
+Request event (``kind = "request"``):
+
+- method, path, path_template (e.g. "/api/invoices/{id}")
+- status (`None` after an exception), error
+- bytes_sent, bytes_received (decompressed body; `None` for streamed
+  responses, their size is in the parse event)
+- ttfb_seconds (time to the response headers), total_seconds
+- retries, cache_hit (304 from the response cache), replayed (cassette),
+  streamed
+
+Parse event (``kind = "parse"``):
+
+- method, path, path_template, seconds, item_count, bytes_received
+  (streamed responses only)
+
+*EndpointMetrics* is a hook which aggregates the events per endpoint.
+"""
+
+import re
+import threading
+from munch import Munch as Bunch
+
+
+# Numeric path segments --> "{id}"
+_ID_SEGMENT_PATTERN = re.compile(r"/\d+(?=/|$)")
+
+
+def get_path_template(path):
+    """
+    Returns the path without query string and with "{id}" instead of ids,
+    e.g. "/api/invoices/123/complete" --> "/api/invoices/{id}/complete"
+    """
+
+    path = path.split("?", 1)[0]
+    return _ID_SEGMENT_PATTERN.sub("/{id}", path)
+
+
+class Histogram(object):
+    """
+    Histogram with exponential buckets (1 ms, 2 ms, 4 ms, ... ~9 min)
+    """
+
+    bounds = [0.001 * 2 ** exponent for exponent in range(20)]
+
+
+    def __init__(self):
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+
+    def add(self, value):
+        for index, bound in enumerate(self.bounds):
+            if value <= bound:
+                break
+        else:
+            index = len(self.bounds)
+        self.counts[index] += 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+
+    def percentile(self, percent):
+        """
+        Returns the upper bound of the bucket with the percentile
+        (at most the maximum value); `None` if empty
+        """
+
+        if not self.count:
+            return
+        rank = self.count * percent / 100.0
+        cumulated = 0
+        for index, count in enumerate(self.counts):
+            cumulated += count
+            if cumulated >= rank and count:
+                if index < len(self.bounds):
+                    return min(self.bounds[index], self.max)
+                return self.max
+        return self.max
+
+
+    @property
+    def mean(self):
+        if not self.count:
+            return
+        return self.total / self.count
+
+
+class EndpointMetrics(object):
+    """
+    Hook which aggregates the events per endpoint (method and path template)
+
+    Usage::
+
+        metrics = EndpointMetrics()
+        conn = Connection(..., hooks = [metrics])
+        ...
+        print metrics.report()
+    """
+
+    def __init__(self):
+        self._endpoints = {}
+        self._lock = threading.Lock()
+
+
+    def _get_endpoint(self, event):
+        key = (event.method, event.path_template)
+        endpoint = self._endpoints.get(key)
+        if endpoint is None:
+            endpoint = self._endpoints[key] = Bunch(
+                method = event.method,
+                path_template = event.path_template,
+                count = 0,
+                errors = 0,
+                retries = 0,
+                cache_hits = 0,
+                bytes_sent = 0,
+                bytes_received = 0,
+                ttfb = Histogram(),
+                total = Histogram(),
+                parse = Histogram(),
+                parsed_items = 0,
+            )
+        return endpoint
+
+
+    def __call__(self, event):
+        with self._lock:
+            endpoint = self._get_endpoint(event)
+            if event.kind == "parse":
+                endpoint.parse.add(event.seconds)
+                endpoint.parsed_items += event.item_count
+                # Streamed responses are read while parsing
+                endpoint.bytes_received += event.get("bytes_received") or 0
+                return
+
+            endpoint.count += 1
+            endpoint.retries += event.retries
+            if event.error is not None or (event.status or 0) >= 400:
+                endpoint.errors += 1
+            if event.cache_hit:
+                endpoint.cache_hits += 1
+            endpoint.bytes_sent += event.bytes_sent or 0
+            endpoint.bytes_received += event.bytes_received or 0
+            if event.ttfb_seconds is not None:
+                endpoint.ttfb.add(event.ttfb_seconds)
+            endpoint.total.add(event.total_seconds)
+
+
+    def get_stats(self):
+        """
+        Returns one Bunch per endpoint, sorted by the summed up
+        network and parsing time (descending)
+        """
+
+        with self._lock:
+            endpoints = list(self._endpoints.values())
+        return sorted(
+            endpoints,
+            key = lambda endpoint: endpoint.total.total + endpoint.parse.total,
+            reverse = True
+        )
+
+
+    def report(self):
+        """
+        Returns a text table with the endpoints
+        """
+
+        def milliseconds(seconds):
+            return (seconds or 0.0) * 1000
+
+        lines = [
+            "{0:<7} {1:<40} {2:>7} {3:>6} {4:>10} {5:>10} {6:>10} "
+            "{7:>10} {8:>10}".format(
+                "method", "path", "count", "errors", "network s",
+                "parse s", "p50 ms", "p99 ms", "KB in"
+            )
+        ]
+        for endpoint in self.get_stats():
+            lines.append(
+                "{0:<7} {1:<40} {2:>7} {3:>6} {4:>10.3f} {5:>10.3f} "
+                "{6:>10.1f} {7:>10.1f} {8:>10.1f}".format(
+                    endpoint.method,
+                    endpoint.path_template,
+                    endpoint.count,
+                    endpoint.errors,
+                    endpoint.total.total,
+                    endpoint.parse.total,
+                    milliseconds(endpoint.total.percentile(50)),
+                    milliseconds(endpoint.total.percentile(99)),
+                    endpoint.bytes_received / 1024.0,
+                )
+            )
+        return "\n".join(lines)
+
+
+    def clear(self):
+        with self._lock:
+            self._endpoints.clear()
@@ -0,0 +1,479 @@
+#!/usr/bin/env python
+# coding: utf-8
+"""
+Local SQLite mirror
+
+Mirrors invoices, invoice items, invoice payments, clients, contacts and
+articles into a SQLite database. The field values of every object are
+stored as pickle; the fields for searching and sorting are additionally
+stored in indexed columns (dates as "YYYY-MM-DD").
+The query API returns the same Item-objects (*Invoice*, *Client*, ...)
+as the API.
+"""
+
+import cPickle as pickle
+import datetime
+import sqlite3
+from munch import Munch as Bunch
+from _items_base import _iter_concurrent
+from articles import Article, ArticlesIterator
+from clients import Client, ClientsIterator
+from contacts import Contact, Contacts
+from invoice_items import InvoiceItem, InvoiceItems
+from invoice_payments import InvoicePayment, InvoicePaymentsIterator
+from invoices import Invoice, InvoicesIterator
+
+
+# Table --> (Item-class, indexed columns, parent column)
+TABLES = {
+    "invoices": (
+        Invoice,
+        (
+            "client_id", "contact_id", "invoice_number", "status", "date",
+            "due_date", "total_gross", "total_net", "open_amount",
+        ),
+        None,
+    ),
+    "invoice_items": (
+        InvoiceItem,
+        ("invoice_id", "article_id"),
+        "invoice_id",
+    ),
+    "invoice_payments": (
+        InvoicePayment,
+        ("invoice_id", "date", "amount"),
+        "invoice_id",
+    ),
+    "clients": (
+        Client,
+        ("client_number", "name", "email"),
+        None,
+    ),
+    "contacts": (
+        Contact,
+        ("client_id", "email"),
+        "client_id",
+    ),
+    "articles": (
+        Article,
+        ("article_number", "title"),
+        None,
+    ),
+}
+
+# Item-class --> table
+_CLASS_TABLES = dict(
+    (item_class, table) for table, (item_class, columns, parent_column)
+    in TABLES.items()
+)
+
+# Indexes: table --> columns
+_INDEXES = {
+    "invoices": ("client_id", "status", "date", "invoice_number"),
+    "invoice_items": ("invoice_id", "article_id"),
+    "invoice_payments": ("invoice_id", "date"),
+    "clients": ("client_number", "name", "email"),
+    "contacts": ("client_id", "email"),
+    "articles": ("article_number",),
+}
+
+
+def _to_column_value(value):
+    """
+    Converts a field value into a SQLite value
+    """
+
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    return value
+
+
+class SQLiteMirror(object):
+    """
+    Local copy of the Billomat data in a SQLite database
+
+    The first *sync()* loads all objects. The following *sync()*-calls
+    load only new objects (id ordering, stops at the highest known id)
+    and the invoices and payments of the last *lookback_days* (date
+    filters *from_date*/*to_date*). Contacts are loaded again for the new
+    clients and for the clients of these invoices. Deleted objects, changes
+    of older invoices, clients or articles and new or changed contacts of
+    other clients are only taken over by ``sync(full = True)``.
+    """
+
+    def __init__(
+        self,
+        conn,
+        filename,
+        lookback_days = 30,
+        per_page = 250,
+        workers = 4,
+        batch_size = 50
+    ):
+        """
+        :param conn: Connection-Object; the loaded objects use this connection
+        :param filename: Path of the SQLite database (":memory:" = in memory)
+        :param lookback_days: Invoices and payments with a date in this
+            count of days before the last sync are loaded again by every
+            incremental sync (status and amounts change after creation)
+        :param per_page: Page size of the list requests
+        :param workers: Count of concurrent requests for invoice items
+            and contacts
+        :param batch_size: Count of invoice IDs per invoice-items request
+        """
+
+        self.conn = conn
+        self.filename = filename
+        self.lookback_days = lookback_days
+        self.per_page = per_page
+        self.workers = workers
+        self.batch_size = batch_size
+
+        self.db = sqlite3.connect(filename)
+        self._create_tables()
+
+
+    def _create_tables(self):
+        """
+        Creates the tables and indexes if they don't exist
+        """
+
+        for table, (item_class, columns, parent_column) in TABLES.items():
+            self.db.execute(
+                "CREATE TABLE IF NOT EXISTS {table} "
+                "(id INTEGER PRIMARY KEY, {columns}, data BLOB NOT NULL)".format(
+                    table = table, columns = ", ".join(columns)
+                )
+            )
+            for column in _INDEXES[table]:
+                self.db.execute(
+                    "CREATE INDEX IF NOT EXISTS {table}_{column} "
+                    "ON {table} ({column})".format(table = table, column = column)
+                )
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS sync_state "
+            "(name TEXT PRIMARY KEY, value TEXT)"
+        )
+        self.db.commit()
+
+
+    def _get_state(self, name):
+        row = self.db.execute(
+            "SELECT value FROM sync_state WHERE name = ?", (name,)
+        ).fetchone()
+        if row:
+            return row[0]
+
+
+    def _set_state(self, name, value):
+        self.db.execute(
+            "INSERT OR REPLACE INTO sync_state (name, value) VALUES (?, ?)",
+            (name, value)
+        )
+
+
+    def _get_max_id(self, table):
+        return self.db.execute(
+            "SELECT MAX(id) FROM {table}".format(table = table)
+        ).fetchone()[0] or 0
+
+
+    def _store(self, table, items):
+        """
+        Inserts or replaces the objects in the table
+
+        :returns: Count of stored objects
+        """
+
+        item_class, columns, parent_column = TABLES[table]
+        statement = (
+            "INSERT OR REPLACE INTO {table} (id, {columns}, data) "
+            "VALUES (?, {placeholders}, ?)".format(
+                table = table,
+                columns = ", ".join(columns),
+                placeholders = ", ".join("?" for column in columns)
+            )
+        )
+
+        # Count of rows (*rowcount* is -1 after *executemany* without rows)
+        row_count = [0]
+
+        def rows():
+            for item in items:
+                row_count[0] += 1
+                fields = item._get_identity_fields()
+                yield (
+                    [item.id] +
+                    [_to_column_value(fields.get(column)) for column in columns] +
+                    [sqlite3.Binary(pickle.dumps(fields, pickle.HIGHEST_PROTOCOL))]
+                )
+
+        self.db.executemany(statement, rows())
+        return row_count[0]
+
+
+    def _replace_children(self, table, parent_ids, items):
+        """
+        Replaces all objects of the parents (e.g. the items of invoices)
+        """
+
+        item_class, columns, parent_column = TABLES[table]
+        parent_ids = list(parent_ids)
+        for start in range(0, len(parent_ids), 500):
+            batch = parent_ids[start:start + 500]
+            self.db.execute(
+                "DELETE FROM {table} WHERE {parent_column} IN ({placeholders})".format(
+                    table = table,
+                    parent_column = parent_column,
+                    placeholders = ", ".join("?" for id in batch)
+                ),
+                batch
+            )
+        return self._store(table, items)
+
+
+    def _iter_new(self, iterator, max_id):
+        """
+        Iterates over the found objects in descending id order until
+        the first known object
+        """
+
+        for item in iterator:
+            if item.id <= max_id:
+                break
+            yield item
+
+
+    def _fetch_invoice_items(self, invoice_ids):
+        """
+        Loads the items of the invoices (*batch_size* invoices per request)
+        """
+
+        invoice_ids = list(invoice_ids)
+        batches = [
+            invoice_ids[start:start + self.batch_size]
+            for start in range(0, len(invoice_ids), self.batch_size)
+        ]
+
+        def fetch(batch):
+            invoice_items = InvoiceItems(self.conn)
+            invoice_items.search(
+                invoice_id = batch, fetch_all = True, per_page = self.per_page
+            )
+            return invoice_items
+
+        items = []
+        for invoice_items in _iter_concurrent(fetch, batches, self.workers):
+            items.extend(invoice_items)
+        return items
+
+
+    def _fetch_contacts(self, client_ids):
+        """
+        Loads the contacts of the clients (one request per client)
+        """
+
+        def fetch(client_id):
+            contacts = Contacts(self.conn)
+            contacts.search(
+                client_id = client_id, fetch_all = True, per_page = self.per_page
+            )
+            return contacts
+
+        items = []
+        for contacts in _iter_concurrent(fetch, list(client_ids), self.workers):
+            items.extend(contacts)
+        return items
+
+
+    def _sync_full(self):
+        """
+        Loads all objects into emptied tables
+        """
+
+        for table in TABLES:
+            self.db.execute("DELETE FROM {table}".format(table = table))
+
+        counts = Bunch()
+
+        # Clients and contacts
+        clients = list(self._search(ClientsIterator, order_by = "id"))
+        counts.clients = self._store("clients", clients)
+        counts.contacts = self._store(
+            "contacts", self._fetch_contacts(client.id for client in clients)
+        )
+
+        # Articles
+        counts.articles = self._store(
+            "articles", self._search(ArticlesIterator, order_by = "id")
+        )
+
+        # Invoices, items and payments
+        invoices = list(self._search(InvoicesIterator, order_by = "id"))
+        counts.invoices = self._store("invoices", invoices)
+        counts.invoice_items = self._store(
+            "invoice_items",
+            self._fetch_invoice_items(invoice.id for invoice in invoices)
+        )
+        counts.invoice_payments = self._store(
+            "invoice_payments",
+            self._search(InvoicePaymentsIterator, order_by = "id")
+        )
+
+        return counts
+
+
+    def _sync_incremental(self, last_sync_date):
+        """
+        Loads new objects and the invoices and payments of the last days
+        """
+
+        from_date = (
+            last_sync_date - datetime.timedelta(days = self.lookback_days)
+        ).isoformat()
+        counts = Bunch()
+
+        # New clients
+        clients = list(self._iter_new(
+            self._search(ClientsIterator, order_by = "id DESC"),
+            self._get_max_id("clients")
+        ))
+        counts.clients = self._store("clients", clients)
+
+        # New articles
+        counts.articles = self._store("articles", self._iter_new(
+            self._search(ArticlesIterator, order_by = "id DESC"),
+            self._get_max_id("articles")
+        ))
+
+        # New invoices and invoices of the last days
+        invoices = {}
+        for invoice in self._iter_new(
+            self._search(InvoicesIterator, order_by = "id DESC"),
+            self._get_max_id("invoices")
+        ):
+            invoices[invoice.id] = invoice
+        for invoice in self._search(
+            InvoicesIterator, order_by = "id", from_date = from_date
+        ):
+            invoices[invoice.id] = invoice
+        counts.invoices = self._store("invoices", invoices.values())
+        invoice_ids = sorted(invoices)
+        counts.invoice_items = self._replace_children(
+            "invoice_items", invoice_ids, self._fetch_invoice_items(invoice_ids)
+        )
+
+        # Contacts of the new clients and of the clients of these invoices
+        client_ids = set(client.id for client in clients)
+        client_ids.update(
+            invoice.client_id for invoice in invoices.values()
+            if invoice.get("client_id")
+        )
+        client_ids = sorted(client_ids)
+        counts.contacts = self._replace_children(
+            "contacts", client_ids, self._fetch_contacts(client_ids)
+        )
+
+        # Payments of the last days
+        counts.invoice_payments = self._store(
+            "invoice_payments",
+            self._search(
+                InvoicePaymentsIterator, order_by = "id", from_date = from_date
+            )
+        )
+
+        return counts
+
+
+    def _search(self, iterator_class, **search_params):
+        iterator = iterator_class(self.conn, per_page = self.per_page)
+        iterator.search(**search_params)
+        return iterator
+
+
+    def sync(self, full = False):
+        """
+        Synchronizes the database with the server
+
+        :param full: If `True`, all objects are loaded again
+            (also done by the first sync)
+
+        :returns: Bunch with the count of stored objects per table
+        """
+
+        today = datetime.date.today()
+        last_sync_date = self._get_state("last_sync_date")
+
+        try:
+            if full or not last_sync_date:
+                counts = self._sync_full()
+            else:
+                last_sync_date = datetime.datetime.strptime(
+                    last_sync_date, "%Y-%m-%d"
+                ).date()
+                counts = self._sync_incremental(last_sync_date)
+            self._set_state("last_sync_date", today.isoformat())
+            self.db.commit()
+        except:
+            self.db.rollback()
+            raise
+
+        return counts
+
+
+    def _create_item(self, item_class, data):
+        item = item_class(self.conn)
+        item._load_identity_fields(pickle.loads(str(data)))
+        return item
+
+
+    def query(
+        self,
+        item_class,
+        where = None,
+        parameters = (),
+        order_by = "id",
+        limit = None
+    ):
+        """
+        Returns the stored objects of the class
+
+        :param item_class: *Invoice*, *InvoiceItem*, *InvoicePayment*,
+            *Client*, *Contact* or *Article*
+        :param where: SQL-condition with the indexed columns, e.g.
+            ``"client_id = ? AND date >= ?"`` (dates as "YYYY-MM-DD")
+        :param parameters: Values for the placeholders in *where*
+        :param order_by: SQL-sort order, e.g. "date DESC"
+        :param limit: Maximum count of objects
+
+        :returns: List with Item-objects
+        """
+
+        statement = "SELECT data FROM {table}".format(
+            table = _CLASS_TABLES[item_class]
+        )
+        if where:
+            statement += " WHERE " + where
+        if order_by:
+            statement += " ORDER BY " + order_by
+        if limit:
+            statement += " LIMIT {0:d}".format(limit)
+
+        return [
+            self._create_item(item_class, data)
+            for (data,) in self.db.execute(statement, parameters)
+        ]
+
+
+    def get(self, item_class, id):
+        """
+        Returns the stored object with the id or `None`
+        """
+
+        items = self.query(item_class, where = "id = ?", parameters = (id,))
+        if items:
+            return items[0]
+
+
+    def close(self):
+        self.db.close()
@@ -12,7 +12,7 @@ import errors
 import xml.etree.ElementTree as ET
 from munch import Munch as Bunch
 from http import Url
-from _items_base import Item, ItemsIterator
+from _items_base import Item, Items, ItemsIterator
 
 
 def _recurring_email_receiver_xml(
@@ -161,7 +161,10 @@ class RecurringEmailReceiver(Item):
             raise errors.BillomatError(unicode(response.data, encoding = "utf-8"))
 
 
-class RecurringEmailReceivers(list):
+class RecurringEmailReceivers(Items):
+
+    item_class = RecurringEmailReceiver
+
 
     def __init__(self, conn):
         """
@@ -170,13 +173,7 @@ class RecurringEmailReceivers(list):
         :param conn: Connection-Object
         """
 
-        list.__init__(self)
-
-        self.conn = conn
-        self.per_page = None
-        self.total = None
-        self.page = None
-        self.pages = None
+        Items.__init__(self, conn = conn)
 
 
     def search(
@@ -186,6 +183,7 @@ class RecurringEmailReceivers(list):
 
         order_by = None,
         fetch_all = False,
+        fetch_all_workers = 1,
         keep_old_items = False,
         page = 1,
         per_page = None
@@ -200,6 +198,9 @@ class RecurringEmailReceivers(list):
             If no order is specified, ascending order (ASC) is used.
             Nested sort orders are possible. Please separate the sort orders by
             comma.
+        :param fetch_all_workers: Count of concurrent requests if *fetch_all*
+            is `True`. After the first page, all remaining pages are fetched
+            in parallel. The order of the items is preserved.
         """
 
         # Check empty param
@@ -226,40 +227,11 @@ class RecurringEmailReceivers(list):
         url.query["recurring_id"] = recurring_id
 
         # Fetch data
-        response = self.conn.get(path = str(url))
-
-        # Parse XML
-        recurring_email_receivers_etree = ET.fromstring(response.data)
-
-        self.per_page = int(recurring_email_receivers_etree.attrib.get("per_page", "100"))
-        self.total = int(recurring_email_receivers_etree.attrib.get("total", "0"))
-        self.page = int(recurring_email_receivers_etree.attrib.get("page", "1"))
-        try:
-            self.pages = (self.total // self.per_page) + int(bool(self.total % self.per_page))
-        except ZeroDivisionError:
-            self.pages = 0
-
-        # Iterate over all items
-        for recurring_email_receiver_etree in recurring_email_receivers_etree:
-            self.append(
-                RecurringEmailReceiver(
-                    conn = self.conn,
-                    recurring_email_receiver_etree = recurring_email_receiver_etree
-                )
-            )
+        self._load_page(url)
 
         # Fetch all
-        if fetch_all and self.total > (self.page * self.per_page):
-            self.search(
-                # Search parameters
-                recurring_id = recurring_id,
-
-                order_by = order_by,
-                fetch_all = fetch_all,
-                keep_old_items = True,
-                page = page + 1,
-                per_page = per_page
-            )
+        if fetch_all:
+            self._load_remaining_pages(url = url, workers = fetch_all_workers)
 
 
 class RecurringEmailReceiversIterator(ItemsIterator):
@@ -295,6 +267,7 @@ class RecurringEmailReceiversIterator(ItemsIterator):
         self.search_params.order_by = order_by
 
         # Search and prepare first page as result
+        self._clear_page_cache()
         self.load_page(1)
 
 
@@ -12,7 +12,7 @@ import errors
 import xml.etree.ElementTree as ET
 from munch import Munch as Bunch
 from http import Url
-from _items_base import Item, ItemsIterator
+from _items_base import Item, Items, ItemsIterator
 
 
 def _recurring_item_xml(
@@ -25,10 +25,13 @@ def _recurring_item_xml(
     tax_rate = None,
     title = None,
     description = None,
-    reduction = None
+    reduction = None,
+    as_etree = False
 ):
     """
     Creates the XML to add or edit a recurring-item
+
+    :param as_etree: If `True`, the XML-element is returned
     """
 
     integer_fieldnames = [
@@ -74,12 +77,39 @@ def _recurring_item_xml(
             new_tag.text = unicode(value)
             recurring_item_tag.append(new_tag)
 
+    if as_etree:
+        return recurring_item_tag
+
     xml = ET.tostring(recurring_item_tag)
 
     # Finished
     return xml
 
 
+def _recurring_items_etree(recurring_items):
+    """
+    Creates the <recurring-items>-element with the items of a new recurring
+
+    :param recurring_items: List with RecurringItem-Objects or dictionaries
+    """
+
+    recurring_items_tag = ET.Element("recurring-items")
+    for recurring_item in recurring_items:
+        recurring_items_tag.append(_recurring_item_xml(
+            article_id = recurring_item.get("article_id"),
+            unit = recurring_item.get("unit"),
+            quantity = recurring_item.get("quantity"),
+            unit_price = recurring_item.get("unit_price"),
+            tax_name = recurring_item.get("tax_name"),
+            tax_rate = recurring_item.get("tax_rate"),
+            title = recurring_item.get("title"),
+            description = recurring_item.get("description"),
+            reduction = recurring_item.get("reduction"),
+            as_etree = True
+        ))
+    return recurring_items_tag
+
+
 class RecurringItem(Item):
 
     base_path = u"/api/recurring-items"
@@ -242,7 +272,10 @@ class RecurringItem(Item):
             raise errors.BillomatError(unicode(response.data, encoding = "utf-8"))
 
 
-class RecurringItems(list):
+class RecurringItems(Items):
+
+    item_class = RecurringItem
+
 
     def __init__(self, conn):
         """
@@ -251,13 +284,7 @@ class RecurringItems(list):
         :param conn: Connection-Object
         """
 
-        list.__init__(self)
-
-        self.conn = conn
-        self.per_page = None
-        self.total = None
-        self.page = None
-        self.pages = None
+        Items.__init__(self, conn = conn)
 
 
     def search(
@@ -267,6 +294,7 @@ class RecurringItems(list):
 
         order_by = None,
         fetch_all = False,
+        fetch_all_workers = 1,
         keep_old_items = False,
         page = 1,
         per_page = None
@@ -285,6 +313,9 @@ class RecurringItems(list):
             If no order is specified, ascending order (ASC) is used.
             Nested sort orders are possible. Please separate the sort orders by
             comma.
+        :param fetch_all_workers: Count of concurrent requests if *fetch_all*
+            is `True`. After the first page, all remaining pages are fetched
+            in parallel. The order of the items is preserved.
         """
 
         # Check empty param
@@ -314,37 +345,11 @@ class RecurringItems(list):
         url.query["recurring_id"] = recurring_id
 
         # Fetch data
-        response = self.conn.get(path = str(url))
-
-        # Parse XML
-        recurring_items_etree = ET.fromstring(response.data)
-
-        self.per_page = int(recurring_items_etree.attrib.get("per_page", "100"))
-        self.total = int(recurring_items_etree.attrib.get("total", "0"))
-        self.page = int(recurring_items_etree.attrib.get("page", "1"))
-        try:
-            self.pages = (self.total // self.per_page) + int(bool(self.total % self.per_page))
-        except ZeroDivisionError:
-            self.pages = 0
-
-        # Iterate over all items
-        for recurring_item_etree in recurring_items_etree:
-            self.append(
-                RecurringItem(conn = self.conn, recurring_item_etree = recurring_item_etree)
-            )
+        self._load_page(url)
 
         # Fetch all
-        if fetch_all and self.total > (self.page * self.per_page):
-            self.search(
-                # Search parameters
-                recurring_id = recurring_id,
-
-                order_by = order_by,
-                fetch_all = fetch_all,
-                keep_old_items = True,
-                page = page + 1,
-                per_page = per_page
-            )
+        if fetch_all:
+            self._load_remaining_pages(url = url, workers = fetch_all_workers)
 
 
 class RecurringItemsIterator(ItemsIterator):
@@ -386,6 +391,7 @@ class RecurringItemsIterator(ItemsIterator):
         self.search_params.order_by = order_by
 
         # Search and prepare first page as result
+        self._clear_page_cache()
         self.load_page(1)
 
 
@@ -13,7 +13,8 @@ import xml.etree.ElementTree as ET
 import errors
 from munch import Munch as Bunch
 from http import Url
-from _items_base import Item, ItemsIterator
+from _items_base import Item, Items, ItemsIterator
+from recurring_items import _recurring_items_etree
 
 
 def _recurring_xml(
@@ -49,7 +50,8 @@ def _recurring_xml(
     email_template_id = None,
     offer_id = None,
     confirmation_id = None,
-    template_id = None
+    template_id = None,
+    recurring_items = None
 ):
     """
     Creates the XML to add or edit a recurring
@@ -144,6 +146,10 @@ def _recurring_xml(
             new_tag.text = unicode(value)
             recurring_tag.append(new_tag)
 
+    # Items
+    if recurring_items:
+        recurring_tag.append(_recurring_items_etree(recurring_items))
+
     xml = ET.tostring(recurring_tag)
 
     # Finished
@@ -267,8 +273,8 @@ class Recurring(Item):
         email_template_id = None,
         offer_id = None,
         confirmation_id = None,
-        template_id = None
-        # recurring_items = None
+        template_id = None,
+        recurring_items = None
     ):
         """
         Creates a recurring
@@ -320,7 +326,10 @@ class Recurring(Item):
         :param confirmation_id: The ID of the confirmation, if the recurring
             was created from a confirmation.
         :param template_id: Template ID
-        # :param recurring_items: List with RecurringItem-Objects
+        :param recurring_items: List with RecurringItem-Objects or
+            dictionaries (article_id, unit, quantity, unit_price, tax_name,
+            tax_rate, title, description, reduction); created with the
+            recurring
         """
 
         # XML
@@ -357,7 +366,8 @@ class Recurring(Item):
             email_template_id = email_template_id,
             offer_id = offer_id,
             confirmation_id = confirmation_id,
-            template_id = template_id
+            template_id = template_id,
+            recurring_items = recurring_items
         )
 
         # Send POST-request
@@ -514,7 +524,10 @@ class Recurring(Item):
             raise errors.BillomatError(unicode(response.data, encoding = "utf-8"))
 
 
-class Recurrings(list):
+class Recurrings(Items):
+
+    item_class = Recurring
+
 
     def __init__(self, conn):
         """
@@ -523,13 +536,7 @@ class Recurrings(list):
         :param conn: Connection-Object
         """
 
-        list.__init__(self)
-
-        self.conn = conn
-        self.per_page = None
-        self.total = None
-        self.page = None
-        self.pages = None
+        Items.__init__(self, conn = conn)
 
 
     def search(
@@ -547,6 +554,7 @@ class Recurrings(list):
 
         order_by = None,
         fetch_all = False,
+        fetch_all_workers = 1,
         allow_empty_filter = False,
         keep_old_items = False,
         page = 1,
@@ -579,6 +587,9 @@ class Recurrings(list):
 
         :param allow_empty_filter: If `True`, every filter-parameter may be empty.
             So, all invoices will returned. !!! EVERY INVOICE !!!
+        :param fetch_all_workers: Count of concurrent requests if *fetch_all*
+            is `True`. After the first page, all remaining pages are fetched
+            in parallel. The order of the items is preserved.
         """
 
         # Check empty filter
@@ -633,44 +644,11 @@ class Recurrings(list):
             url.query["tags"] = tags
 
         # Fetch data
-        response = self.conn.get(path = str(url))
-
-        # Parse XML
-        recurrings_etree = ET.fromstring(response.data)
-
-        self.per_page = int(recurrings_etree.attrib.get("per_page", "100"))
-        self.total = int(recurrings_etree.attrib.get("total", "0"))
-        self.page = int(recurrings_etree.attrib.get("page", "1"))
-        try:
-            self.pages = (self.total // self.per_page) + int(bool(self.total % self.per_page))
-        except ZeroDivisionError:
-            self.pages = 0
-
-        # Iterate over all recurrings
-        for recurring_etree in recurrings_etree:
-            self.append(Recurring(conn = self.conn, recurring_etree = recurring_etree))
+        self._load_page(url)
 
         # Fetch all
-        if fetch_all and self.total > (self.page * self.per_page):
-            self.search(
-                # Search parameters
-                client_id = client_id,
-                contact_id = contact_id,
-                name = name,
-                payment_type = payment_type,
-                cycle = cycle,
-                label = label,
-                intro = intro,
-                note = note,
-                tags = tags,
-
-                order_by = order_by,
-                fetch_all = fetch_all,
-                allow_empty_filter = allow_empty_filter,
-                keep_old_items = True,
-                page = page + 1,
-                per_page = per_page
-            )
+        if fetch_all:
+            self._load_remaining_pages(url = url, workers = fetch_all_workers)
 
 
 class RecurringsIterator(ItemsIterator):
@@ -730,6 +708,7 @@ class RecurringsIterator(ItemsIterator):
         self.search_params.order_by = order_by
 
         # Search and prepare first page as result
+        self._clear_page_cache()
         self.load_page(1)
 
 
@@ -11,7 +11,7 @@ import errors
 import xml.etree.ElementTree as ET
 from munch import Munch as Bunch
 from http import Url
-from _items_base import Item, ItemsIterator
+from _items_base import Item, Items, ItemsIterator
 
 
 def _reminder_item_xml(
@@ -211,7 +211,10 @@ class ReminderItem(Item):
             raise errors.BillomatError(unicode(response.data, encoding = "utf-8"))
 
 
-class ReminderItems(list):
+class ReminderItems(Items):
+
+    item_class = ReminderItem
+
 
     def __init__(self, conn):
         """
@@ -220,13 +223,7 @@ class ReminderItems(list):
         :param conn: Connection-Object
         """
 
-        list.__init__(self)
-
-        self.conn = conn
-        self.per_page = None
-        self.total = None
-        self.page = None
-        self.pages = None
+        Items.__init__(self, conn = conn)
 
 
     def search(
@@ -236,6 +233,7 @@ class ReminderItems(list):
 
         order_by = None,
         fetch_all = False,
+        fetch_all_workers = 1,
         keep_old_items = False,
         page = 1,
         per_page = None
@@ -251,6 +249,9 @@ class ReminderItems(list):
             Nested sort orders are possible. Please separate the sort orders by
             comma.
 
+        :param fetch_all_workers: Count of concurrent requests if *fetch_all*
+            is `True`. After the first page, all remaining pages are fetched
+            in parallel. The order of the items is preserved.
         """
 
         # Check empty param
@@ -277,37 +278,11 @@ class ReminderItems(list):
         url.query["reminder_id"] = reminder_id
 
         # Fetch data
-        response = self.conn.get(path = str(url))
-
-        # Parse XML
-        reminder_items_etree = ET.fromstring(response.data)
-
-        self.per_page = int(reminder_items_etree.attrib.get("per_page", "100"))
-        self.total = int(reminder_items_etree.attrib.get("total", "0"))
-        self.page = int(reminder_items_etree.attrib.get("page", "1"))
-        try:
-            self.pages = (self.total // self.per_page) + int(bool(self.total % self.per_page))
-        except ZeroDivisionError:
-            self.pages = 0
-
-        # Iterate over all items
-        for reminder_item_etree in reminder_items_etree:
-            self.append(
-                ReminderItem(conn = self.conn, reminder_item_etree = reminder_item_etree)
-            )
+        self._load_page(url)
 
         # Fetch all
-        if fetch_all and self.total > (self.page * self.per_page):
-            self.search(
-                # Search parameters
-                reminder_id = reminder_id,
-
-                order_by = order_by,
-                fetch_all = fetch_all,
-                keep_old_items = True,
-                page = page + 1,
-                per_page = per_page
-            )
+        if fetch_all:
+            self._load_remaining_pages(url = url, workers = fetch_all_workers)
 
 
 class ReminderItemsIterator(ItemsIterator):
@@ -343,6 +318,7 @@ class ReminderItemsIterator(ItemsIterator):
         self.search_params.order_by = order_by
 
         # Search and prepare first page as result
+        self._clear_page_cache()
         self.load_page(1)
 
 
@@ -11,7 +11,7 @@ import xml.etree.ElementTree as ET
 import errors
 from munch import Munch as Bunch
 from http import Url
-from _items_base import Item, ItemsIterator
+from _items_base import Item, Items, ItemsIterator
 
 
 def _reminder_text_xml(
@@ -220,7 +220,11 @@ class ReminderText(Item):
             raise errors.BillomatError(unicode(response.data, encoding = "utf-8"))
 
 
-class ReminderTexts(list):
+class ReminderTexts(Items):
+
+    item_class = ReminderText
+    default_per_page = 0
+
 
     def __init__(self, conn):
         """
@@ -229,13 +233,7 @@ class ReminderTexts(list):
         :param conn: Connection-Object
         """
 
-        list.__init__(self)
-
-        self.conn = conn
-        self.per_page = None
-        self.total = None
-        self.page = None
-        self.pages = None
+        Items.__init__(self, conn = conn)
 
 
     def search(
@@ -244,6 +242,7 @@ class ReminderTexts(list):
         order_by = None,
 
         fetch_all = False,
+        fetch_all_workers = 1,
         keep_old_items = False,
         page = 1,
         per_page = None
@@ -258,6 +257,9 @@ class ReminderTexts(list):
             If no order is specified, ascending order (ASC) is used.
             Nested sort orders are possible. Please separate the sort orders by
             comma.
+        :param fetch_all_workers: Count of concurrent requests if *fetch_all*
+            is `True`. After the first page, all remaining pages are fetched
+            in parallel. The order of the items is preserved.
         """
         
         # Empty the list
@@ -277,37 +279,11 @@ class ReminderTexts(list):
             url.query["order_by"] = order_by
 
         # Fetch data
-        response = self.conn.get(path = str(url))
-
-        # Parse XML
-        reminder_texts_etree = ET.fromstring(response.data)
-
-        self.per_page = int(reminder_texts_etree.attrib.get("per_page", "0"))
-        self.total = int(reminder_texts_etree.attrib.get("total", "0"))
-        self.page = int(reminder_texts_etree.attrib.get("page", "1"))
-        try:
-            self.pages = (self.total // self.per_page) + int(bool(self.total % self.per_page))
-        except ZeroDivisionError:
-            self.pages = 0
-
-        # Iterate over all email templates
-        for reminder_text_etree in reminder_texts_etree:
-            self.append(
-                ReminderText(
-                    conn = self.conn,
-                    reminder_text_etree = reminder_text_etree
-                )
-            )
+        self._load_page(url)
 
         # Fetch all
-        if fetch_all and self.total > (self.page * self.per_page):
-            self.search(
-                order_by = order_by,
-                fetch_all = fetch_all,
-                keep_old_items = True,
-                page = page + 1,
-                per_page = per_page
-            )
+        if fetch_all:
+            self._load_remaining_pages(url = url, workers = fetch_all_workers)
 
 
 class ReminderTextsIterator(ItemsIterator):
@@ -340,6 +316,7 @@ class ReminderTextsIterator(ItemsIterator):
         self.search_params.order_by = order_by
 
         # Search and prepare first page as result
+        self._clear_page_cache()
         self.load_page(1)
 
 
@@ -11,7 +11,7 @@ import xml.etree.ElementTree as ET
 from munch import Munch as Bunch
 from http import Url
 import errors
-from _items_base import Item, ItemsIterator
+from _items_base import Item, Items, ItemsIterator
 
 
 def _reminder_xml(
@@ -381,7 +381,10 @@ class Reminder(Item):
             raise errors.BillomatError("\n".join(error_text_list))
 
 
-class Reminders(list):
+class Reminders(Items):
+
+    item_class = Reminder
+
 
     def __init__(self, conn):
         """
@@ -390,13 +393,7 @@ class Reminders(list):
         :param conn: Connection-Object
         """
 
-        list.__init__(self)
-
-        self.conn = conn
-        self.per_page = None
-        self.total = None
-        self.page = None
-        self.pages = None
+        Items.__init__(self, conn = conn)
 
 
     def search(
@@ -417,6 +414,7 @@ class Reminders(list):
 
         order_by = None,
         fetch_all = False,
+        fetch_all_workers = 1,
         allow_empty_filter = False,
         keep_old_items = False,
         page = 1,
@@ -450,6 +448,9 @@ class Reminders(list):
 
         :param allow_empty_filter: If `True`, every filter-parameter may be empty.
             So, all reminders will returned. !!! EVERY !!!
+        :param fetch_all_workers: Count of concurrent requests if *fetch_all*
+            is `True`. After the first page, all remaining pages are fetched
+            in parallel. The order of the items is preserved.
         """
         
         # Check empty filter
@@ -513,47 +514,11 @@ class Reminders(list):
             url.query["article_id"] = article_id
 
         # Fetch data
-        response = self.conn.get(path = str(url))
-
-        # Parse XML
-        reminders_etree = ET.fromstring(response.data)
-
-        self.per_page = int(reminders_etree.attrib.get("per_page", "100"))
-        self.total = int(reminders_etree.attrib.get("total", "0"))
-        self.page = int(reminders_etree.attrib.get("page", "1"))
-        try:
-            self.pages = (self.total // self.per_page) + int(bool(self.total % self.per_page))
-        except ZeroDivisionError:
-            self.pages = 0
-
-        # Iterate over all reminders
-        for reminder_etree in reminders_etree:
-            self.append(Reminder(conn = self.conn, reminder_etree = reminder_etree))
+        self._load_page(url)
 
         # Fetch all
-        if fetch_all and self.total > (self.page * self.per_page):
-            self.search(
-                # Search parameters
-                client_id = client_id,
-                contact_id = contact_id,
-                invoice_number = invoice_number,
-                status = status,
-                from_date = from_date,
-                to_date = to_date,
-                subject = subject,
-                label = label,
-                intro = intro,
-                note = note,
-                tags = tags,
-                article_id = article_id,
-
-                order_by = order_by,
-                fetch_all = fetch_all,
-                allow_empty_filter = allow_empty_filter,
-                keep_old_items = True,
-                page = page + 1,
-                per_page = per_page
-            )
+        if fetch_all:
+            self._load_remaining_pages(url = url, workers = fetch_all_workers)
 
 
 class RemindersIterator(ItemsIterator):
@@ -624,6 +589,7 @@ class RemindersIterator(ItemsIterator):
         self.search_params.order_by = order_by
 
         # Search and prepare first page as result
+        self._clear_page_cache()
         self.load_page(1)
 
 
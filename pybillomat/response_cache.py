@@ -0,0 +1,187 @@
+#!/usr/bin/env python
+# coding: utf-8
+"""
+Response cache for conditional GET-requests
+
+The cache stores the body of a response together with its *ETag* and
+*Last-Modified* headers. *Connection.get* sends *If-None-Match* and
+*If-Modified-Since* with the next request and reuses the cached body if
+the server answers with "304 Not Modified".
+"""
+
+import collections
+import cPickle as pickle
+import hashlib
+import os
+import tempfile
+import threading
+
+
+class CachedResponse(object):
+    """
+    Response created from a cache entry
+
+    Has no *stream*-method, so the body is always read from *data*.
+    """
+
+    def __init__(self, data, headers, status = 200):
+        self.status = status
+        self.data = data
+        self.headers = headers
+
+
+    def release_conn(self):
+        pass
+
+
+def create_cache_entry(response):
+    """
+    Returns a cache entry (dictionary) for a response or `None`,
+    if the response has neither *ETag* nor *Last-Modified*
+    """
+
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if not etag and not last_modified:
+        return
+
+    headers = {}
+    for name in ("Content-Type", "Content-Language"):
+        value = response.headers.get(name)
+        if value is not None:
+            headers[name.lower()] = value
+
+    return {
+        "data": response.data,
+        "headers": headers,
+        "etag": etag,
+        "last_modified": last_modified,
+    }
+
+
+class MemoryResponseCache(object):
+    """
+    Thread-safe in-memory LRU cache with a byte budget
+    """
+
+    def __init__(self, max_bytes = 10 * 1024 * 1024):
+        """
+        :param max_bytes: Maximum size of all cached bodies; the least
+            recently used entries are removed if the budget is exceeded
+        """
+
+        self.max_bytes = max_bytes
+        self.size_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+
+    def get(self, key):
+        """
+        Returns the cache entry for *key* or `None`
+        """
+
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                self.misses += 1
+                return
+            self._entries[key] = entry
+            self.hits += 1
+            return entry
+
+
+    def set(self, key, entry):
+        """
+        Stores a cache entry and removes the least recently used entries
+        """
+
+        size_bytes = len(entry["data"])
+        if size_bytes > self.max_bytes:
+            return
+
+        with self._lock:
+            old_entry = self._entries.pop(key, None)
+            if old_entry is not None:
+                self.size_bytes -= len(old_entry["data"])
+            self._entries[key] = entry
+            self.size_bytes += size_bytes
+            while self.size_bytes > self.max_bytes:
+                old_key, old_entry = self._entries.popitem(last = False)
+                self.size_bytes -= len(old_entry["data"])
+
+
+    def clear(self):
+        """
+        Removes all entries
+        """
+
+        with self._lock:
+            self._entries.clear()
+            self.size_bytes = 0
+
+
+class DiskResponseCache(object):
+    """
+    Cache with one pickle-file per entry in a directory
+    """
+
+    def __init__(self, directory):
+        """
+        :param directory: Cache directory; created if it doesn't exist
+        """
+
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+
+    def _get_filename(self, key):
+        if isinstance(key, unicode):
+            key = key.encode("utf-8")
+        return os.path.join(
+            self.directory, hashlib.sha1(key).hexdigest() + ".pickle"
+        )
+
+
+    def get(self, key):
+        """
+        Returns the cache entry for *key* or `None`
+        """
+
+        try:
+            with open(self._get_filename(key), "rb") as cache_file:
+                entry = pickle.load(cache_file)
+        except (IOError, EOFError, pickle.UnpicklingError):
+            self.misses += 1
+            return
+        self.hits += 1
+        return entry
+
+
+    def set(self, key, entry):
+        """
+        Stores a cache entry
+
+        The file is written under a temporary name and renamed afterwards,
+        so other threads or processes never read an incomplete entry.
+        """
+
+        file_descriptor, temp_filename = tempfile.mkstemp(dir = self.directory)
+        with os.fdopen(file_descriptor, "wb") as cache_file:
+            pickle.dump(entry, cache_file, pickle.HIGHEST_PROTOCOL)
+        os.rename(temp_filename, self._get_filename(key))
+
+
+    def clear(self):
+        """
+        Removes all entries
+        """
+
+        for filename in os.listdir(self.directory):
+            if filename.endswith(".pickle"):
+                os.remove(os.path.join(self.directory, filename))
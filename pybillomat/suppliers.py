@@ -12,7 +12,7 @@ import errors
 import xml.etree.ElementTree as ET
 from munch import Munch as Bunch
 from http import Url
-from _items_base import Item, ItemsIterator
+from _items_base import Item, Items, ItemsIterator
 
 
 def _supplier_xml(
@@ -369,7 +369,10 @@ class Supplier(Item):
             raise errors.BillomatError(unicode(response.data, encoding = "utf-8"))
 
 
-class Suppliers(list):
+class Suppliers(Items):
+
+    item_class = Supplier
+
 
     def __init__(self, conn):
         """
@@ -378,13 +381,7 @@ class Suppliers(list):
         :param conn: Connection-Object
         """
 
-        list.__init__(self)
-
-        self.conn = conn
-        self.per_page = None
-        self.total = None
-        self.page = None
-        self.pages = None
+        Items.__init__(self, conn = conn)
 
 
     def search(
@@ -403,6 +400,7 @@ class Suppliers(list):
 
         order_by = None,
         fetch_all = False,
+        fetch_all_workers = 1,
         allow_empty_filter = False,
         keep_old_items = False,
         page = 1,
@@ -431,6 +429,9 @@ class Suppliers(list):
 
         :param allow_empty_filter: If `True`, every filter-parameter may be empty.
             So, all invoices will returned. !!! EVERY INVOICE !!!
+        :param fetch_all_workers: Count of concurrent requests if *fetch_all*
+            is `True`. After the first page, all remaining pages are fetched
+            in parallel. The order of the items is preserved.
         """
 
         # Check empty filter
@@ -488,47 +489,11 @@ class Suppliers(list):
             url.query["tags"] = tags
 
         # Fetch data
-        response = self.conn.get(path = str(url))
-
-        # Parse XML
-        suppliers_etree = ET.fromstring(response.data)
-
-        self.per_page = int(suppliers_etree.attrib.get("per_page", "100"))
-        self.total = int(suppliers_etree.attrib.get("total", "0"))
-        self.page = int(suppliers_etree.attrib.get("page", "1"))
-        try:
-            self.pages = (self.total // self.per_page) + int(bool(self.total % self.per_page))
-        except ZeroDivisionError:
-            self.pages = 0
-
-        # Iterate over all suppliers
-        for supplier_etree in suppliers_etree:
-            self.append(
-                Supplier(conn = self.conn, supplier_etree = supplier_etree)
-            )
+        self._load_page(url)
 
         # Fetch all
-        if fetch_all and self.total > (self.page * self.per_page):
-            self.search(
-                # Search parameters
-                name = name,
-                email = email,
-                first_name = first_name,
-                last_name = last_name,
-                country_code = country_code,
-                creditor_identifier = creditor_identifier,
-                note = note,
-                client_number = client_number,
-                incoming_id = incoming_id,
-                tags = tags,
-
-                order_by = order_by,
-                fetch_all = fetch_all,
-                allow_empty_filter = allow_empty_filter,
-                keep_old_items = True,
-                page = page + 1,
-                per_page = per_page
-            )
+        if fetch_all:
+            self._load_remaining_pages(url = url, workers = fetch_all_workers)
 
 
 class SuppliersIterator(ItemsIterator):
@@ -594,6 +559,7 @@ class SuppliersIterator(ItemsIterator):
         self.search_params.order_by = order_by
 
         # Search and prepare first page as result
+        self._clear_page_cache()
         self.load_page(1)
 
 